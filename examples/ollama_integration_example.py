@@ -37,6 +37,13 @@ class OllamaRoboEyes:
     - Error: Angry mood for errors
     """
     
+    # Thinking animation steps, built once and replayed on every message
+    THINKING_STEPS = (
+        (0, lambda r: r.set_position(7)),     # Look left
+        (500, lambda r: r.set_position(6)),   # Look right
+        (1000, lambda r: r.set_position(0)),  # Look center
+    )
+    
     def __init__(self, ollama_url="http://localhost:11434", model="llama2"):
         """
         Initialize the Ollama RoboEyes integration.
@@ -65,6 +72,9 @@ class OllamaRoboEyes:
         # Initialize RoboEyes
         self.robo = DesktopRoboEyes(config=config)
         
+        # Thinking sequence is created lazily and restarted for each message
+        self.thinking_seq = None
+        
         # Set initial state
         self.set_idle_state()
         
@@ -91,12 +101,13 @@ class OllamaRoboEyes:
         self.robo.mood = CURIOUS
         self.robo.set_auto_blinker(OFF)
         self.robo.set_idle_mode(OFF)
-        # Create a thinking animation sequence
-        seq = self.robo.sequences.add("thinking")
-        seq.step(0, lambda r: r.set_position(7))    # Look left
-        seq.step(500, lambda r: r.set_position(6))  # Look right
-        seq.step(1000, lambda r: r.set_position(0)) # Look center
-        seq.start()
+        # Replay the thinking animation sequence
+        if self.thinking_seq is None:
+            self.thinking_seq = self.robo.sequences.add("thinking")
+            for ms_timing, action in self.THINKING_STEPS:
+                self.thinking_seq.step(ms_timing, action)
+        self.thinking_seq.reset()
+        self.thinking_seq.start()
     
     def set_responding_state(self):
         """Set eyes to responding state - generating response."""
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers for desktop RoboEyes.
+"""
+
+import sys
+
+# slots=True needs Python 3.10+; older versions keep the regular __dict__ layout
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
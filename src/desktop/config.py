@@ -5,19 +5,24 @@ This module provides configuration loading, saving, validation, and command-line
 argument parsing for the RoboEyes desktop application.
 """
 
-import argparse
 import json
-import os
-from dataclasses import dataclass, asdict, fields
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Union
 
+from ._compat import DATACLASS_SLOTS
 from .exceptions import ConfigurationError
 from .logging import get_logger
 from .platform_compat import get_platform_compat
 
+if TYPE_CHECKING:
+    import argparse
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class RoboEyesConfig:
     """Configuration settings for the desktop RoboEyes application."""
     # Window settings
@@ -51,6 +56,195 @@ class RoboEyesConfig:
     debug: bool = False
 
 
+def _field_type_check(expected_type: Any) -> Tuple[Tuple[type, ...], bool]:
+    """
+    Resolve a field annotation into isinstance() types and whether None is allowed.
+    
+    Optional/Union annotations accept any of their non-None members, and
+    Tuple annotations accept tuples or lists (JSON has no tuples).
+    """
+    origin = getattr(expected_type, '__origin__', None)
+    if origin is Union:
+        args = expected_type.__args__
+        return tuple(arg for arg in args if arg is not type(None)), type(None) in args
+    if origin is tuple:
+        return (tuple, list), False
+    return (expected_type,), False
+
+
+# (name, annotation, default, accepted types, None allowed) for every config field,
+# resolved once so validation does not re-inspect the annotations on each call
+_CONFIG_FIELDS = tuple(
+    (field.name, field.type, field.default) + _field_type_check(field.type)
+    for field in fields(RoboEyesConfig)
+)
+
+# Field names in declaration order and a single getter for all their values
+_CONFIG_FIELD_NAMES = tuple(field[0] for field in _CONFIG_FIELDS)
+_get_config_values = attrgetter(*_CONFIG_FIELD_NAMES)
+
+
+def _config_to_dict(config: RoboEyesConfig) -> Dict[str, Any]:
+    """
+    Shallow field-name to value dict of a config.
+    
+    All field values are immutable, so this matches dataclasses.asdict
+    without its recursive copying.
+    """
+    return dict(zip(_CONFIG_FIELD_NAMES, _get_config_values(config)))
+
+
+# Valid (low, high, error message) range for each numeric config field
+_FIELD_RANGES = {
+    # Window dimensions
+    'window_width': (100, 4000, "window_width must be between 100 and 4000 pixels"),
+    'window_height': (100, 4000, "window_height must be between 100 and 4000 pixels"),
+    # Display dimensions
+    'display_width': (32, 1024, "display_width must be between 32 and 1024 pixels"),
+    'display_height': (32, 1024, "display_height must be between 32 and 1024 pixels"),
+    # Eye dimensions
+    'eye_width': (8, 128, "eye_width must be between 8 and 128 pixels"),
+    'eye_height': (8, 128, "eye_height must be between 8 and 128 pixels"),
+    # Frame rate
+    'frame_rate': (1, 120, "frame_rate must be between 1 and 120 FPS"),
+    # Scale factor
+    'scale_factor': (0.1, 10.0, "scale_factor must be between 0.1 and 10.0"),
+    # Timing intervals
+    'blink_interval': (0.1, 60.0, "blink_interval must be between 0.1 and 60.0 seconds"),
+    'idle_interval': (0.1, 60.0, "idle_interval must be between 0.1 and 60.0 seconds"),
+    # Timing variations
+    'blink_variation': (0, 30, "blink_variation must be between 0 and 30 seconds"),
+    'idle_variation': (0, 30, "idle_variation must be between 0 and 30 seconds"),
+}
+
+# Fields holding an RGB color
+_COLOR_FIELDS = frozenset(('background_color', 'foreground_color'))
+
+# Read-only view of the RoboEyesConfig field defaults
+_CONFIG_DEFAULTS = MappingProxyType({field[0]: field[2] for field in _CONFIG_FIELDS})
+
+
+@lru_cache(maxsize=None)
+def _default_config_path(filename: str) -> str:
+    """
+    Resolve (and create) the platform config directory once per process.
+    
+    Every ConfigManager created without an explicit file asks for this path.
+    """
+    # Use platform-appropriate config directory
+    platform_compat = get_platform_compat()
+    config_dir = platform_compat.get_config_dir()
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return str(config_dir / filename)
+
+
+@lru_cache(maxsize=None)
+def _build_argument_parser() -> 'argparse.ArgumentParser':
+    """
+    Build the command-line parser once per process.
+    
+    parse_args() does not modify the parser, so every ConfigManager can
+    share it. Numeric defaults come from the RoboEyesConfig field defaults.
+    argparse is imported here so loading a config file does not pay for it.
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="RoboEyes Desktop - Animated robot eyes for your desktop",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    
+    # Window settings
+    window_group = parser.add_argument_group('Window Settings')
+    window_group.add_argument(
+        '--window-width', type=int, default=_CONFIG_DEFAULTS['window_width'],
+        help='Window width in pixels (100-4000)'
+    )
+    window_group.add_argument(
+        '--window-height', type=int, default=_CONFIG_DEFAULTS['window_height'],
+        help='Window height in pixels (100-4000)'
+    )
+    window_group.add_argument(
+        '--fullscreen', action='store_true',
+        help='Start in fullscreen mode'
+    )
+    window_group.add_argument(
+        '--no-resize', action='store_true',
+        help='Disable window resizing'
+    )
+    
+    # Display settings
+    display_group = parser.add_argument_group('Display Settings')
+    display_group.add_argument(
+        '--display-width', type=int, default=_CONFIG_DEFAULTS['display_width'],
+        help='Eye display width in pixels (32-1024)'
+    )
+    display_group.add_argument(
+        '--display-height', type=int, default=_CONFIG_DEFAULTS['display_height'],
+        help='Eye display height in pixels (32-1024)'
+    )
+    display_group.add_argument(
+        '--eye-width', type=int, default=_CONFIG_DEFAULTS['eye_width'],
+        help='Individual eye width in pixels (8-128)'
+    )
+    display_group.add_argument(
+        '--eye-height', type=int, default=_CONFIG_DEFAULTS['eye_height'],
+        help='Individual eye height in pixels (8-128)'
+    )
+    display_group.add_argument(
+        '--scale-factor', type=float, default=_CONFIG_DEFAULTS['scale_factor'],
+        help='Display scaling factor (0.1-10.0)'
+    )
+    
+    # Animation settings
+    animation_group = parser.add_argument_group('Animation Settings')
+    animation_group.add_argument(
+        '--frame-rate', type=int, default=_CONFIG_DEFAULTS['frame_rate'],
+        help='Target frame rate in FPS (1-120)'
+    )
+    animation_group.add_argument(
+        '--auto-blinker', action='store_true',
+        help='Enable automatic blinking'
+    )
+    animation_group.add_argument(
+        '--blink-interval', type=float, default=_CONFIG_DEFAULTS['blink_interval'],
+        help='Blink interval in seconds (0.1-60.0)'
+    )
+    animation_group.add_argument(
+        '--blink-variation', type=int, default=_CONFIG_DEFAULTS['blink_variation'],
+        help='Blink timing variation in seconds (0-30)'
+    )
+    animation_group.add_argument(
+        '--idle-mode', action='store_true',
+        help='Enable idle eye movement'
+    )
+    animation_group.add_argument(
+        '--idle-interval', type=float, default=_CONFIG_DEFAULTS['idle_interval'],
+        help='Idle movement interval in seconds (0.1-60.0)'
+    )
+    animation_group.add_argument(
+        '--idle-variation', type=int, default=_CONFIG_DEFAULTS['idle_variation'],
+        help='Idle timing variation in seconds (0-30)'
+    )
+    
+    # Configuration file
+    config_group = parser.add_argument_group('Configuration')
+    config_group.add_argument(
+        '--config', type=str,
+        help='Path to configuration file'
+    )
+    config_group.add_argument(
+        '--save-config', action='store_true',
+        help='Save current settings to configuration file'
+    )
+    config_group.add_argument(
+        '--debug', action='store_true',
+        help='Enable debug mode'
+    )
+    
+    return parser
+
+
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
     
@@ -68,11 +262,7 @@ class ConfigManager:
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
-        # Use platform-appropriate config directory
-        platform_compat = get_platform_compat()
-        config_dir = platform_compat.get_config_dir()
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return str(config_dir / self.DEFAULT_CONFIG_FILENAME)
+        return _default_config_path(self.DEFAULT_CONFIG_FILENAME)
     
     def load_config(self, config_file: Optional[str] = None) -> RoboEyesConfig:
         """
@@ -90,22 +280,21 @@ class ConfigManager:
         logger = get_logger()
         file_path = config_file or self.config_file
         
-        if not os.path.exists(file_path):
-            logger.info(f"Configuration file not found: {file_path}, using defaults")
-            return RoboEyesConfig()
-        
         try:
-            logger.debug(f"Loading configuration from: {file_path}")
-            with open(file_path, 'r') as f:
-                config_data = json.load(f)
+            logger.debug("Loading configuration from: %s", file_path)
+            # Read directly; a missing file is reported by the read itself
+            config_data = json.loads(Path(file_path).read_text())
             
             # Validate and create config object
             validated_data = self._validate_config_data(config_data)
             self._config = RoboEyesConfig(**validated_data)
             
-            logger.info(f"Configuration loaded successfully from: {file_path}")
+            logger.info("Configuration loaded successfully from: %s", file_path)
             return self._config
             
+        except FileNotFoundError:
+            logger.info("Configuration file not found: %s, using defaults", file_path)
+            return RoboEyesConfig()
         except json.JSONDecodeError as e:
             error_msg = f"Invalid JSON in configuration file {file_path}: {e}"
             logger.error(error_msg)
@@ -138,18 +327,18 @@ class ConfigManager:
         file_path = config_file or self.config_file
         
         try:
-            logger.debug(f"Saving configuration to: {file_path}")
+            logger.debug("Saving configuration to: %s", file_path)
+            
+            path = Path(file_path)
             
             # Ensure directory exists
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            path.parent.mkdir(parents=True, exist_ok=True)
             
             # Convert config to dictionary and save
-            config_dict = asdict(config)
-            
-            with open(file_path, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            config_dict = _config_to_dict(config)
+            path.write_text(json.dumps(config_dict, indent=2))
             
-            logger.info(f"Configuration saved successfully to: {file_path}")
+            logger.info("Configuration saved successfully to: %s", file_path)
                 
         except (IOError, OSError) as e:
             error_msg = f"Failed to save configuration to {file_path}: {e}"
@@ -160,12 +349,15 @@ class ConfigManager:
             logger.exception(error_msg)
             raise ConfigurationError(error_msg)
     
-    def _validate_config_data(self, config_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_config_data(self, config_data: Dict[str, Any],
+                              only_present: bool = False) -> Dict[str, Any]:
         """
         Validate configuration data and apply defaults for missing values.
         
         Args:
             config_data: Raw configuration data from file
+            only_present: Validate and return only the fields present in
+                config_data instead of filling in defaults
             
         Returns:
             Validated configuration data
@@ -174,61 +366,28 @@ class ConfigManager:
             ConfigurationError: If validation fails
         """
         validated_data = {}
-        config_fields = {field.name: field for field in fields(RoboEyesConfig)}
         
-        for field_name, field_info in config_fields.items():
+        for field_name, field_type, default, accepted_types, none_ok in _CONFIG_FIELDS:
             if field_name in config_data:
                 value = config_data[field_name]
                 
                 # Type validation
-                if not self._validate_field_type(value, field_info.type):
+                if not (none_ok if value is None else isinstance(value, accepted_types)):
                     raise ConfigurationError(
-                        f"Invalid type for field '{field_name}': expected {field_info.type}, got {type(value)}"
+                        f"Invalid type for field '{field_name}': expected {field_type}, got {type(value)}"
                     )
                 
                 # Range validation
                 validated_value = self._validate_field_range(field_name, value)
                 validated_data[field_name] = validated_value
+            elif only_present:
+                continue
             else:
                 # Use default value if field is missing
-                validated_data[field_name] = field_info.default
+                validated_data[field_name] = default
         
         return validated_data
     
-    def _validate_field_type(self, value: Any, expected_type: type) -> bool:
-        """
-        Validate that a value matches the expected type.
-        
-        Args:
-            value: Value to validate
-            expected_type: Expected type
-            
-        Returns:
-            True if type is valid, False otherwise
-        """
-        # Handle special cases for typing annotations
-        if hasattr(expected_type, '__origin__'):
-            if expected_type.__origin__ is Union:
-                # Handle Optional types (Union[T, None])
-                if value is None:
-                    return type(None) in expected_type.__args__
-                return any(isinstance(value, arg) for arg in expected_type.__args__ if arg is not type(None))
-            elif expected_type.__origin__ is tuple:
-                # Handle Tuple types
-                return isinstance(value, (tuple, list))
-        
-        # Handle Optional types in Python 3.10+ style
-        if str(expected_type).startswith('typing.Union') or str(expected_type).startswith('typing.Optional'):
-            if value is None:
-                return 'NoneType' in str(expected_type) or 'None' in str(expected_type)
-            # Extract the non-None type from Optional[T]
-            if hasattr(expected_type, '__args__'):
-                non_none_types = [arg for arg in expected_type.__args__ if arg is not type(None)]
-                if non_none_types:
-                    return isinstance(value, non_none_types[0])
-        
-        return isinstance(value, expected_type)
-    
     def _validate_field_range(self, field_name: str, value: Any) -> Any:
         """
         Validate field value ranges and apply constraints.
@@ -243,33 +402,15 @@ class ConfigManager:
         Raises:
             ConfigurationError: If value is out of valid range
         """
-        # Window dimensions
-        if field_name in ('window_width', 'window_height'):
-            if not (100 <= value <= 4000):
-                raise ConfigurationError(f"{field_name} must be between 100 and 4000 pixels")
-        
-        # Display dimensions
-        elif field_name in ('display_width', 'display_height'):
-            if not (32 <= value <= 1024):
-                raise ConfigurationError(f"{field_name} must be between 32 and 1024 pixels")
-        
-        # Eye dimensions
-        elif field_name in ('eye_width', 'eye_height'):
-            if not (8 <= value <= 128):
-                raise ConfigurationError(f"{field_name} must be between 8 and 128 pixels")
-        
-        # Frame rate
-        elif field_name == 'frame_rate':
-            if not (1 <= value <= 120):
-                raise ConfigurationError("frame_rate must be between 1 and 120 FPS")
-        
-        # Scale factor
-        elif field_name == 'scale_factor':
-            if not (0.1 <= value <= 10.0):
-                raise ConfigurationError("scale_factor must be between 0.1 and 10.0")
+        # Numeric ranges
+        field_range = _FIELD_RANGES.get(field_name)
+        if field_range is not None:
+            low, high, message = field_range
+            if not (low <= value <= high):
+                raise ConfigurationError(message)
         
         # Color values
-        elif field_name in ('background_color', 'foreground_color'):
+        elif field_name in _COLOR_FIELDS:
             if isinstance(value, (list, tuple)) and len(value) == 3:
                 # Validate RGB values
                 for i, component in enumerate(value):
@@ -280,16 +421,6 @@ class ConfigManager:
             else:
                 raise ConfigurationError(f"{field_name} must be a 3-element RGB tuple/list")
         
-        # Timing intervals
-        elif field_name in ('blink_interval', 'idle_interval'):
-            if not (0.1 <= value <= 60.0):
-                raise ConfigurationError(f"{field_name} must be between 0.1 and 60.0 seconds")
-        
-        # Timing variations
-        elif field_name in ('blink_variation', 'idle_variation'):
-            if not (0 <= value <= 30):
-                raise ConfigurationError(f"{field_name} must be between 0 and 30 seconds")
-        
         return value
     
     def parse_command_line(self, args: Optional[list] = None) -> RoboEyesConfig:
@@ -302,98 +433,7 @@ class ConfigManager:
         Returns:
             RoboEyesConfig instance with command-line overrides
         """
-        parser = argparse.ArgumentParser(
-            description="RoboEyes Desktop - Animated robot eyes for your desktop",
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter
-        )
-        
-        # Window settings
-        window_group = parser.add_argument_group('Window Settings')
-        window_group.add_argument(
-            '--window-width', type=int, default=800,
-            help='Window width in pixels (100-4000)'
-        )
-        window_group.add_argument(
-            '--window-height', type=int, default=600,
-            help='Window height in pixels (100-4000)'
-        )
-        window_group.add_argument(
-            '--fullscreen', action='store_true',
-            help='Start in fullscreen mode'
-        )
-        window_group.add_argument(
-            '--no-resize', action='store_true',
-            help='Disable window resizing'
-        )
-        
-        # Display settings
-        display_group = parser.add_argument_group('Display Settings')
-        display_group.add_argument(
-            '--display-width', type=int, default=128,
-            help='Eye display width in pixels (32-1024)'
-        )
-        display_group.add_argument(
-            '--display-height', type=int, default=64,
-            help='Eye display height in pixels (32-1024)'
-        )
-        display_group.add_argument(
-            '--eye-width', type=int, default=36,
-            help='Individual eye width in pixels (8-128)'
-        )
-        display_group.add_argument(
-            '--eye-height', type=int, default=36,
-            help='Individual eye height in pixels (8-128)'
-        )
-        display_group.add_argument(
-            '--scale-factor', type=float, default=1.0,
-            help='Display scaling factor (0.1-10.0)'
-        )
-        
-        # Animation settings
-        animation_group = parser.add_argument_group('Animation Settings')
-        animation_group.add_argument(
-            '--frame-rate', type=int, default=60,
-            help='Target frame rate in FPS (1-120)'
-        )
-        animation_group.add_argument(
-            '--auto-blinker', action='store_true',
-            help='Enable automatic blinking'
-        )
-        animation_group.add_argument(
-            '--blink-interval', type=float, default=1.0,
-            help='Blink interval in seconds (0.1-60.0)'
-        )
-        animation_group.add_argument(
-            '--blink-variation', type=int, default=4,
-            help='Blink timing variation in seconds (0-30)'
-        )
-        animation_group.add_argument(
-            '--idle-mode', action='store_true',
-            help='Enable idle eye movement'
-        )
-        animation_group.add_argument(
-            '--idle-interval', type=float, default=1.0,
-            help='Idle movement interval in seconds (0.1-60.0)'
-        )
-        animation_group.add_argument(
-            '--idle-variation', type=int, default=3,
-            help='Idle timing variation in seconds (0-30)'
-        )
-        
-        # Configuration file
-        config_group = parser.add_argument_group('Configuration')
-        config_group.add_argument(
-            '--config', type=str,
-            help='Path to configuration file'
-        )
-        config_group.add_argument(
-            '--save-config', action='store_true',
-            help='Save current settings to configuration file'
-        )
-        config_group.add_argument(
-            '--debug', action='store_true',
-            help='Enable debug mode'
-        )
+        parser = _build_argument_parser()
         
         # Parse arguments
         parsed_args = parser.parse_args(args)
@@ -410,78 +450,61 @@ class ConfigManager:
         else:
             base_config = RoboEyesConfig()
         
-        # Override with command-line arguments
-        config_dict = asdict(base_config)
+        # Command-line overrides; base_config is already validated
+        overrides = {}
         
         # Map command-line arguments to config fields (only override if explicitly set)
         # We need to check if the argument was actually provided vs using the default
         
-        # Get the default values from the parser
-        defaults = {
-            'window_width': 800,
-            'window_height': 600,
-            'fullscreen': False,
-            'no_resize': False,
-            'display_width': 128,
-            'display_height': 64,
-            'eye_width': 36,
-            'eye_height': 36,
-            'scale_factor': 1.0,
-            'frame_rate': 60,
-            'auto_blinker': False,
-            'blink_interval': 1.0,
-            'blink_variation': 4,
-            'idle_mode': False,
-            'idle_interval': 1.0,
-            'idle_variation': 3,
-            'debug': False,
-        }
+        # RoboEyesConfig field defaults, built once at import
+        defaults = _CONFIG_DEFAULTS
         
         # Only override config values if they were explicitly provided on command line
         # (i.e., different from defaults or boolean flags that were set)
         if parsed_args.window_width != defaults['window_width']:
-            config_dict['window_width'] = parsed_args.window_width
+            overrides['window_width'] = parsed_args.window_width
         if parsed_args.window_height != defaults['window_height']:
-            config_dict['window_height'] = parsed_args.window_height
+            overrides['window_height'] = parsed_args.window_height
         if parsed_args.fullscreen:  # Boolean flag, only set if True
-            config_dict['fullscreen'] = True
+            overrides['fullscreen'] = True
         if parsed_args.no_resize:  # Boolean flag, only set if True
-            config_dict['resizable'] = False
+            overrides['resizable'] = False
         if parsed_args.display_width != defaults['display_width']:
-            config_dict['display_width'] = parsed_args.display_width
+            overrides['display_width'] = parsed_args.display_width
         if parsed_args.display_height != defaults['display_height']:
-            config_dict['display_height'] = parsed_args.display_height
+            overrides['display_height'] = parsed_args.display_height
         if parsed_args.eye_width != defaults['eye_width']:
-            config_dict['eye_width'] = parsed_args.eye_width
+            overrides['eye_width'] = parsed_args.eye_width
         if parsed_args.eye_height != defaults['eye_height']:
-            config_dict['eye_height'] = parsed_args.eye_height
+            overrides['eye_height'] = parsed_args.eye_height
         if parsed_args.scale_factor != defaults['scale_factor']:
-            config_dict['scale_factor'] = parsed_args.scale_factor
+            overrides['scale_factor'] = parsed_args.scale_factor
         if parsed_args.frame_rate != defaults['frame_rate']:
-            config_dict['frame_rate'] = parsed_args.frame_rate
+            overrides['frame_rate'] = parsed_args.frame_rate
         if parsed_args.auto_blinker:  # Boolean flag, only set if True
-            config_dict['auto_blinker'] = True
+            overrides['auto_blinker'] = True
         if parsed_args.blink_interval != defaults['blink_interval']:
-            config_dict['blink_interval'] = parsed_args.blink_interval
+            overrides['blink_interval'] = parsed_args.blink_interval
         if parsed_args.blink_variation != defaults['blink_variation']:
-            config_dict['blink_variation'] = parsed_args.blink_variation
+            overrides['blink_variation'] = parsed_args.blink_variation
         if parsed_args.idle_mode:  # Boolean flag, only set if True
-            config_dict['idle_mode'] = True
+            overrides['idle_mode'] = True
         if parsed_args.idle_interval != defaults['idle_interval']:
-            config_dict['idle_interval'] = parsed_args.idle_interval
+            overrides['idle_interval'] = parsed_args.idle_interval
         if parsed_args.idle_variation != defaults['idle_variation']:
-            config_dict['idle_variation'] = parsed_args.idle_variation
+            overrides['idle_variation'] = parsed_args.idle_variation
         if parsed_args.debug:  # Boolean flag, only set if True
-            config_dict['debug'] = True
+            overrides['debug'] = True
         
         # Always set config_file if provided
         if parsed_args.config:
-            config_dict['config_file'] = parsed_args.config
+            overrides['config_file'] = parsed_args.config
         
-        # Validate the final configuration
+        # Validate only the overrides and apply them over the base configuration
         try:
-            validated_config = self._validate_config_data(config_dict)
-            final_config = RoboEyesConfig(**validated_config)
+            config_dict = _config_to_dict(base_config)
+            config_dict.update(self._validate_config_data(overrides, only_present=True))
+            final_config = RoboEyesConfig(**config_dict)
         except ConfigurationError as e:
             parser.error(f"Configuration validation failed: {e}")
         
@@ -510,11 +533,10 @@ class ConfigManager:
         Raises:
             ConfigurationError: If validation fails
         """
-        config_dict = asdict(self._config)
-        config_dict.update(kwargs)
-        
-        validated_data = self._validate_config_data(config_dict)
-        self._config = RoboEyesConfig(**validated_data)
+        # The current config is already valid; only the updated fields need checking
+        config_dict = _config_to_dict(self._config)
+        config_dict.update(self._validate_config_data(kwargs, only_present=True))
+        self._config = RoboEyesConfig(**config_dict)
 
 
 def create_default_config() -> RoboEyesConfig:
@@ -97,7 +97,7 @@ class FrameBufferCompat:
                         # Convert RGB back to 0/1 (consider white-ish as 1, dark as 0)
                         return 1 if sum(rgb) > 384 else 0  # 384 = 128 * 3 (mid-gray threshold)
                     else:
-                        logger.warning(f"Pixel get coordinates out of bounds: ({x}, {y})")
+                        logger.warning("Pixel get coordinates out of bounds: (%s, %s)", x, y)
                     return 0
                 else:
                     # Set pixel color
@@ -105,7 +105,7 @@ class FrameBufferCompat:
                         rgb_color = (255, 255, 255) if color else (0, 0, 0)
                         self.surface.set_at((x, y), rgb_color)
                     else:
-                        logger.warning(f"Pixel set coordinates out of bounds: ({x}, {y})")
+                        logger.warning("Pixel set coordinates out of bounds: (%s, %s)", x, y)
                     
         except pygame.error as e:
             error_msg = f"Pygame error accessing pixel at ({x}, {y}): {e}"
@@ -7,11 +7,15 @@ that replace the FBUtil functionality from the original MicroPython version.
 
 import pygame
 import math
-from typing import Tuple
+from typing import Dict, Tuple
 
 from .exceptions import GraphicsError
 from .logging import get_logger
 
+# Transparent key color for pre-rendered rounded-rect stamps
+_RRECT_KEY_COLOR = (255, 0, 255)
+_RRECT_CACHE_SIZE = 256
+
 
 class PygameGraphicsUtil:
     """
@@ -32,6 +36,34 @@ class PygameGraphicsUtil:
         """
         self.surface = pygame_surface
         self.dirty_tracker = dirty_tracker
+        self._rrect_cache: Dict[Tuple[int, int, int, Tuple[int, int, int]], pygame.Surface] = {}
+    
+    def _rrect_stamp(self, w: int, h: int, radius: int, rgb_color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Return a colorkeyed surface holding a filled rounded rectangle.
+        
+        Stamps are rendered once per (size, radius, color) and reused.
+        """
+        key = (w, h, radius, rgb_color)
+        stamp = self._rrect_cache.get(key)
+        if stamp is None:
+            if len(self._rrect_cache) >= _RRECT_CACHE_SIZE:
+                self._rrect_cache.clear()
+            
+            stamp = pygame.Surface((w, h))
+            stamp.fill(_RRECT_KEY_COLOR)
+            stamp.set_colorkey(_RRECT_KEY_COLOR)
+            
+            # Same shapes as a direct draw, relative to the stamp origin
+            pygame.draw.rect(stamp, rgb_color, (radius, 0, w - 2 * radius, h))
+            pygame.draw.rect(stamp, rgb_color, (0, radius, w, h - 2 * radius))
+            pygame.draw.circle(stamp, rgb_color, (radius, radius), radius)  # Top-left
+            pygame.draw.circle(stamp, rgb_color, (w - radius, radius), radius)  # Top-right
+            pygame.draw.circle(stamp, rgb_color, (radius, h - radius), radius)  # Bottom-left
+            pygame.draw.circle(stamp, rgb_color, (w - radius, h - radius), radius)  # Bottom-right
+            
+            self._rrect_cache[key] = stamp
+        return stamp
     
     def fill_rrect(self, x: int, y: int, w: int, h: int, radius: int, color: int) -> None:
         """
@@ -53,11 +85,11 @@ class PygameGraphicsUtil:
         try:
             # Validate parameters
             if w <= 0 or h <= 0:
-                logger.warning(f"Invalid rectangle dimensions: w={w}, h={h}")
+                logger.warning("Invalid rectangle dimensions: w=%s, h=%s", w, h)
                 return
             
             if radius < 0:
-                logger.warning(f"Invalid radius: {radius}, using 0")
+                logger.warning("Invalid radius: %s, using 0", radius)
                 radius = 0
             
             # Convert MicroPython color values (0/1) to RGB
@@ -76,16 +108,8 @@ class PygameGraphicsUtil:
                 pygame.draw.rect(self.surface, rgb_color, (x, y, w, h))
                 return
             
-            # Draw the rounded rectangle using multiple shapes
-            # Main rectangle (center area)
-            pygame.draw.rect(self.surface, rgb_color, (x + radius, y, w - 2 * radius, h))
-            pygame.draw.rect(self.surface, rgb_color, (x, y + radius, w, h - 2 * radius))
-            
-            # Draw corner circles
-            pygame.draw.circle(self.surface, rgb_color, (x + radius, y + radius), radius)  # Top-left
-            pygame.draw.circle(self.surface, rgb_color, (x + w - radius, y + radius), radius)  # Top-right
-            pygame.draw.circle(self.surface, rgb_color, (x + radius, y + h - radius), radius)  # Bottom-left
-            pygame.draw.circle(self.surface, rgb_color, (x + w - radius, y + h - radius), radius)  # Bottom-right
+            # Blit the pre-rendered rounded rectangle
+            self.surface.blit(self._rrect_stamp(w, h, radius, rgb_color), (x, y))
             
         except pygame.error as e:
             error_msg = f"Pygame error drawing rounded rectangle: {e}"
@@ -123,7 +147,7 @@ class PygameGraphicsUtil:
             
             # Validate that we have at least 3 distinct points
             if len(set(points)) < 3:
-                logger.warning(f"Triangle has duplicate vertices: {points}")
+                logger.warning("Triangle has duplicate vertices: %s", points)
                 return
             
             # Track dirty rectangle for triangle bounding box
@@ -5,7 +5,11 @@ This module provides keyboard and mouse input processing, mapping input events
 to RoboEyes functions and providing interactive controls for testing and demonstration.
 """
 
+import logging
+import os
+import sys
 import pygame
+from functools import partial
 from typing import Dict, Callable, Optional, List, Tuple
 from dataclasses import dataclass, field
 
@@ -13,6 +17,26 @@ from .exceptions import InputError
 from .logging import get_logger
 
 
+# Package root holding the roboeyes package, added to sys.path at most once
+_SRC_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+# Pygame mouse button numbers mapped to their mouse_mappings keys
+_MOUSE_BUTTON_ACTIONS = {1: 'left_click', 3: 'right_click'}
+
+# Short help text returned by InputManager.get_help_text
+_HELP_TEXT = (
+    "RoboEyes Desktop Controls",
+    "",
+    "Moods: 1-7 (Default, Tired, Angry, Happy, Frozen, Scary, Curious)",
+    "Positions: Arrow Keys, WASD, or Numpad 1-9",
+    "Animations: SPACE (Blink), Q/E (Wink), C (Confuse), L (Laugh)",
+    "Eye State: O (Open), X (Close)",
+    "Modes: B (Auto-Blinker), I (Idle), Y (Cyclops), R (Curious)",
+    "Mouse: Left Click (Look), Right Click (Blink)",
+    "Help: H or F1, Fullscreen: F11, Exit Fullscreen: ESC",
+)
+
+
 @dataclass
 class InputMapping:
     """Configuration for input mappings."""
@@ -36,63 +60,76 @@ class InputManager:
             roboeyes_instance: The DesktopRoboEyes instance to control
         """
         self.roboeyes = roboeyes_instance
+        # Resolved once; DesktopRoboEyes creates its monitor before the input manager
+        self._performance_monitor = getattr(roboeyes_instance, 'performance_monitor', None)
         self.help_visible = False
         self.help_surface = None
+        # Set once the help text rendered; a fallback surface is rebuilt on the next toggle
+        self._help_rendered = False
+        # Help fonts, loaded the first time the help surface is built
+        self.font = None
+        self.small_font = None
         self._setup_default_mappings()
     
     def _setup_default_mappings(self) -> None:
         """Set up default keyboard and mouse mappings."""
-        # Import mood constants from the roboeyes module
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+        # Import mood constants from the roboeyes module; it imports this module,
+        # so this cannot happen at import time
+        if _SRC_DIR not in sys.path:
+            sys.path.insert(0, _SRC_DIR)
         
         from roboeyes.desktop_roboeyes import (
             DEFAULT, TIRED, ANGRY, HAPPY, FROZEN, SCARY, CURIOUS,
             N, NE, E, SE, S, SW, W, NW
         )
         
+        # Actions are bound methods and partials resolved once here, so a key
+        # press is a single call with no attribute lookups
+        roboeyes = self.roboeyes
+        set_mood = roboeyes.set_mood
+        set_position = roboeyes.set_position
+        
         # Mood mappings
         self.key_mappings = {
-            pygame.K_1: lambda: self.roboeyes.set_mood(DEFAULT),
-            pygame.K_2: lambda: self.roboeyes.set_mood(TIRED),
-            pygame.K_3: lambda: self.roboeyes.set_mood(ANGRY),
-            pygame.K_4: lambda: self.roboeyes.set_mood(HAPPY),
-            pygame.K_5: lambda: self.roboeyes.set_mood(FROZEN),
-            pygame.K_6: lambda: self.roboeyes.set_mood(SCARY),
-            pygame.K_7: lambda: self.roboeyes.set_mood(CURIOUS),
+            pygame.K_1: partial(set_mood, DEFAULT),
+            pygame.K_2: partial(set_mood, TIRED),
+            pygame.K_3: partial(set_mood, ANGRY),
+            pygame.K_4: partial(set_mood, HAPPY),
+            pygame.K_5: partial(set_mood, FROZEN),
+            pygame.K_6: partial(set_mood, SCARY),
+            pygame.K_7: partial(set_mood, CURIOUS),
             
             # Position mappings (numpad)
-            pygame.K_KP8: lambda: self.roboeyes.set_position(N),      # North
-            pygame.K_KP9: lambda: self.roboeyes.set_position(NE),     # North-East
-            pygame.K_KP6: lambda: self.roboeyes.set_position(E),      # East
-            pygame.K_KP3: lambda: self.roboeyes.set_position(SE),     # South-East
-            pygame.K_KP2: lambda: self.roboeyes.set_position(S),      # South
-            pygame.K_KP1: lambda: self.roboeyes.set_position(SW),     # South-West
-            pygame.K_KP4: lambda: self.roboeyes.set_position(W),      # West
-            pygame.K_KP7: lambda: self.roboeyes.set_position(NW),     # North-West
-            pygame.K_KP5: lambda: self.roboeyes.set_position(DEFAULT), # Center
+            pygame.K_KP8: partial(set_position, N),      # North
+            pygame.K_KP9: partial(set_position, NE),     # North-East
+            pygame.K_KP6: partial(set_position, E),      # East
+            pygame.K_KP3: partial(set_position, SE),     # South-East
+            pygame.K_KP2: partial(set_position, S),      # South
+            pygame.K_KP1: partial(set_position, SW),     # South-West
+            pygame.K_KP4: partial(set_position, W),      # West
+            pygame.K_KP7: partial(set_position, NW),     # North-West
+            pygame.K_KP5: partial(set_position, DEFAULT), # Center
             
             # Alternative position mappings (arrow keys + WASD)
-            pygame.K_UP: lambda: self.roboeyes.set_position(N),
-            pygame.K_DOWN: lambda: self.roboeyes.set_position(S),
-            pygame.K_LEFT: lambda: self.roboeyes.set_position(W),
-            pygame.K_RIGHT: lambda: self.roboeyes.set_position(E),
-            pygame.K_w: lambda: self.roboeyes.set_position(N),
-            pygame.K_s: lambda: self.roboeyes.set_position(S),
-            pygame.K_a: lambda: self.roboeyes.set_position(W),
-            pygame.K_d: lambda: self.roboeyes.set_position(E),
+            pygame.K_UP: partial(set_position, N),
+            pygame.K_DOWN: partial(set_position, S),
+            pygame.K_LEFT: partial(set_position, W),
+            pygame.K_RIGHT: partial(set_position, E),
+            pygame.K_w: partial(set_position, N),
+            pygame.K_s: partial(set_position, S),
+            pygame.K_a: partial(set_position, W),
+            pygame.K_d: partial(set_position, E),
             
             # Animation controls
-            pygame.K_SPACE: lambda: self.roboeyes.blink(),
-            pygame.K_q: lambda: self.roboeyes.wink(left=True),
-            pygame.K_e: lambda: self.roboeyes.wink(right=True),
-            pygame.K_c: lambda: self.roboeyes.confuse(),
-            pygame.K_l: lambda: self.roboeyes.laugh(),
+            pygame.K_SPACE: roboeyes.blink,
+            pygame.K_q: partial(roboeyes.wink, left=True),
+            pygame.K_e: partial(roboeyes.wink, right=True),
+            pygame.K_c: roboeyes.confuse,
+            pygame.K_l: roboeyes.laugh,
             
             # Eye state controls
-            pygame.K_o: lambda: self.roboeyes.open(),
-            pygame.K_x: lambda: self.roboeyes.close(),
+            pygame.K_o: roboeyes.open,
+            pygame.K_x: roboeyes.close,
             
             # Mode toggles
             pygame.K_b: self._toggle_auto_blinker,
@@ -108,10 +145,17 @@ class InputManager:
             pygame.K_p: self._toggle_performance_display,
         }
         
+        # Positions for mouse look, resolved once: rows top to bottom, columns left to right
+        self._look_positions = (
+            (NW, N, NE),
+            (W, DEFAULT, E),
+            (SW, S, SE),
+        )
+        
         # Mouse mappings
         self.mouse_mappings = {
-            'left_click': lambda pos: self._handle_mouse_click(pos),
-            'right_click': lambda pos: self._handle_right_click(pos),
+            'left_click': self._handle_mouse_click,
+            'right_click': self._handle_right_click,
         }
     
     def _toggle_auto_blinker(self) -> None:
@@ -141,14 +185,16 @@ class InputManager:
     def _toggle_help(self) -> None:
         """Toggle help display."""
         self.help_visible = not self.help_visible
-        if self.help_visible:
+        # The help text is static, so the surface is only built until it renders
+        if self.help_visible and not self._help_rendered:
             self._create_help_surface()
     
     def _toggle_performance_display(self) -> None:
         """Toggle performance monitoring display."""
-        if hasattr(self.roboeyes, 'performance_monitor'):
-            self.roboeyes.performance_monitor.toggle_performance_display()
-            state = "ON" if self.roboeyes.performance_monitor.show_performance else "OFF"
+        monitor = self._performance_monitor
+        if monitor is not None:
+            monitor.toggle_performance_display()
+            state = "ON" if monitor.show_performance else "OFF"
             print(f"Performance display: {state}")
     
     def _handle_mouse_click(self, pos: Tuple[int, int]) -> None:
@@ -210,36 +256,23 @@ class InputManager:
         center_x = self.roboeyes.display_width // 2
         center_y = self.roboeyes.display_height // 2
         
-        # Determine the closest predefined position
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        
-        from roboeyes.desktop_roboeyes import N, NE, E, SE, S, SW, W, NW, DEFAULT
-        
+        # Determine the closest predefined position (top/middle/bottom row,
+        # left/middle/right column)
         if y < center_y // 2:  # Top third
-            if x < center_x // 2:
-                position = NW
-            elif x > center_x + center_x // 2:
-                position = NE
-            else:
-                position = N
+            row = 0
         elif y > center_y + center_y // 2:  # Bottom third
-            if x < center_x // 2:
-                position = SW
-            elif x > center_x + center_x // 2:
-                position = SE
-            else:
-                position = S
+            row = 2
         else:  # Middle third
-            if x < center_x // 2:
-                position = W
-            elif x > center_x + center_x // 2:
-                position = E
-            else:
-                position = DEFAULT
-        
-        self.roboeyes.set_position(position)
+            row = 1
+        
+        if x < center_x // 2:
+            column = 0
+        elif x > center_x + center_x // 2:
+            column = 2
+        else:
+            column = 1
+        
+        self.roboeyes.set_position(self._look_positions[row][column])
     
     def _create_help_surface(self) -> None:
         """Create the help display surface."""
@@ -247,7 +280,7 @@ class InputManager:
         
         try:
             # Initialize font if not already done
-            if not hasattr(self, 'font'):
+            if self.small_font is None:
                 pygame.font.init()
                 self.font = pygame.font.Font(None, 24)
                 self.small_font = pygame.font.Font(None, 18)
@@ -316,6 +349,8 @@ class InputManager:
                 
                 self.help_surface.blit(text_surface, (20, y_offset))
                 y_offset += line_height
+            
+            self._help_rendered = True
                 
         except pygame.error as e:
             error_msg = f"Pygame error creating help surface: {e}"
@@ -340,19 +375,12 @@ class InputManager:
         Returns:
             True if the event was handled, False otherwise
         """
-        logger = get_logger()
-        
-        try:
-            if event.type == pygame.KEYDOWN:
-                return self._handle_keydown(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                return self._handle_mouse_button(event)
-            return False
-        except Exception as e:
-            # Gracefully handle any input processing errors
-            error_msg = f"Input processing error: {e}"
-            logger.error(error_msg)
-            return False
+        # The handlers catch and log their own errors, so no try block is needed here
+        if event.type == pygame.KEYDOWN:
+            return self._handle_keydown(event)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            return self._handle_mouse_button(event)
+        return False
     
     def _handle_keydown(self, event) -> bool:
         """
@@ -367,11 +395,13 @@ class InputManager:
         logger = get_logger()
         
         try:
-            if event.key in self.key_mappings:
-                logger.debug(f"Processing key: {pygame.key.name(event.key)}")
-                self.key_mappings[event.key]()
-                return True
-            return False
+            action = self.key_mappings.get(event.key)
+            if action is None:
+                return False
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing key: %s", pygame.key.name(event.key))
+            action()
+            return True
         except Exception as e:
             error_msg = f"Error handling keydown event for key {pygame.key.name(event.key)}: {e}"
             logger.error(error_msg)
@@ -390,17 +420,14 @@ class InputManager:
         logger = get_logger()
         
         try:
-            if event.button == 1:  # Left click
-                if 'left_click' in self.mouse_mappings:
-                    logger.debug(f"Processing left mouse click at {event.pos}")
-                    self.mouse_mappings['left_click'](event.pos)
-                    return True
-            elif event.button == 3:  # Right click
-                if 'right_click' in self.mouse_mappings:
-                    logger.debug(f"Processing right mouse click at {event.pos}")
-                    self.mouse_mappings['right_click'](event.pos)
-                    return True
-            return False
+            name = _MOUSE_BUTTON_ACTIONS.get(event.button)
+            action = self.mouse_mappings.get(name) if name is not None else None
+            if action is None:
+                return False
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Processing %s at %s", name, event.pos)
+            action(event.pos)
+            return True
         except Exception as e:
             error_msg = f"Error handling mouse button {event.button} at {event.pos}: {e}"
             logger.error(error_msg)
@@ -423,8 +450,7 @@ class InputManager:
         Args:
             key: Pygame key constant to remove
         """
-        if key in self.key_mappings:
-            del self.key_mappings[key]
+        self.key_mappings.pop(key, None)
     
     def add_mouse_mapping(self, button: str, action: Callable) -> None:
         """
@@ -443,8 +469,7 @@ class InputManager:
         Args:
             button: Mouse button name to remove
         """
-        if button in self.mouse_mappings:
-            del self.mouse_mappings[button]
+        self.mouse_mappings.pop(button, None)
     
     def get_key_mappings(self) -> Dict[int, Callable]:
         """
@@ -497,14 +522,4 @@ class InputManager:
         Returns:
             List of help text lines
         """
-        return [
-            "RoboEyes Desktop Controls",
-            "",
-            "Moods: 1-7 (Default, Tired, Angry, Happy, Frozen, Scary, Curious)",
-            "Positions: Arrow Keys, WASD, or Numpad 1-9",
-            "Animations: SPACE (Blink), Q/E (Wink), C (Confuse), L (Laugh)",
-            "Eye State: O (Open), X (Close)",
-            "Modes: B (Auto-Blinker), I (Idle), Y (Cyclops), R (Curious)",
-            "Mouse: Left Click (Look), Right Click (Blink)",
-            "Help: H or F1, Fullscreen: F11, Exit Fullscreen: ESC"
-        ]
\ No newline at end of file
+        return list(_HELP_TEXT)
\ No newline at end of file
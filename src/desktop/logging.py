@@ -10,7 +10,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 class RoboEyesLogger:
@@ -80,29 +80,43 @@ class RoboEyesLogger:
         except Exception as e:
             self.error(f"Failed to setup file logging: {e}")
     
-    def debug(self, message: str) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Check whether a message of the given level would be emitted.
+        
+        Use this to skip building expensive log messages on hot paths.
+        
+        Args:
+            level: Logging level (e.g. logging.DEBUG)
+            
+        Returns:
+            True if messages at this level are enabled
+        """
+        return self.logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args: Any) -> None:
         """Log debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """Log critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
     
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args: Any) -> None:
         """Log exception with traceback."""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
 
 # Global logger instance
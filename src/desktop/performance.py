@@ -5,6 +5,7 @@ This module provides performance monitoring, dirty rectangle tracking,
 and frame rate optimization features to ensure smooth animation.
 """
 
+import logging
 import pygame
 import time
 import psutil
@@ -13,10 +14,11 @@ from typing import List, Tuple, Optional, Dict, Any
 from collections import deque
 from dataclasses import dataclass
 
+from ._compat import DATACLASS_SLOTS
 from .logging import get_logger
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PerformanceMetrics:
     """Container for performance metrics."""
     fps: float = 0.0
@@ -146,8 +148,9 @@ class DirtyRectTracker:
             List of dirty rectangles that need updating
         """
         self.merge_overlapping_rects()
-        rects = self.dirty_rects.copy()
-        self.dirty_rects.clear()
+        # Hand the list over and start a fresh one rather than copying it
+        rects = self.dirty_rects
+        self.dirty_rects = []
         return rects
     
     def get_update_efficiency(self) -> float:
@@ -202,9 +205,10 @@ class PerformanceMonitor:
         self.cpu_history = deque(maxlen=history_size)
         self.memory_history = deque(maxlen=history_size)
         
-        self.last_frame_time = time.time()
+        # perf_counter is monotonic, so frame times are unaffected by wall-clock adjustments
+        self.last_frame_time = time.perf_counter()
         self.frame_count = 0
-        self.start_time = time.time()
+        self.start_time = self.last_frame_time
         
         # Get process for memory monitoring
         self.process = psutil.Process(os.getpid())
@@ -215,6 +219,8 @@ class PerformanceMonitor:
         self.show_performance = False
         self.performance_font = None
         self.performance_surface = None
+        # Rendered overlay text by line: (text, surface), re-rendered only when the text changes
+        self._overlay_lines: Dict[int, Tuple[str, pygame.Surface]] = {}
     
     def update(self, dirty_rects_count: int = 0, total_pixels_updated: int = 0) -> PerformanceMetrics:
         """
@@ -227,7 +233,7 @@ class PerformanceMonitor:
         Returns:
             Current performance metrics
         """
-        current_time = time.time()
+        current_time = time.perf_counter()
         frame_time = current_time - self.last_frame_time
         self.last_frame_time = current_time
         
@@ -326,7 +332,7 @@ class PerformanceMonitor:
             'avg_cpu_usage': self.get_average_cpu_usage(),
             'avg_memory_mb': self.get_average_memory_usage(),
             'total_frames': self.frame_count,
-            'uptime_seconds': time.time() - self.start_time,
+            'uptime_seconds': time.perf_counter() - self.start_time,
             'history_size': len(self.fps_history)
         }
     
@@ -370,21 +376,28 @@ class PerformanceMonitor:
             overlay_height = len(lines) * line_height + 10
             overlay_width = 250
             
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((overlay_width, overlay_height))
-            overlay.set_alpha(200)
+            # Semi-transparent overlay, created once and cleared each frame
+            overlay = self.performance_surface
+            if overlay is None:
+                overlay = pygame.Surface((overlay_width, overlay_height))
+                overlay.set_alpha(200)
+                self.performance_surface = overlay
             overlay.fill((0, 0, 0))
             
-            # Render text lines
+            # Render text lines; most of them repeat from frame to frame
+            overlay_lines = self._overlay_lines
             for i, line in enumerate(lines):
-                text_surface = self.performance_font.render(line, True, (255, 255, 255))
-                overlay.blit(text_surface, (5, 5 + i * line_height))
+                cached = overlay_lines.get(i)
+                if cached is None or cached[0] != line:
+                    cached = (line, self.performance_font.render(line, True, (255, 255, 255)))
+                    overlay_lines[i] = cached
+                overlay.blit(cached[1], (5, 5 + i * line_height))
             
             # Blit overlay to screen (top-right corner)
             screen.blit(overlay, (screen.get_width() - overlay_width - 10, 10))
             
         except pygame.error as e:
-            self.logger.error(f"Error rendering performance overlay: {e}")
+            self.logger.error("Error rendering performance overlay: %s", e)
     
     def log_performance_summary(self, interval_seconds: int = 30) -> None:
         """
@@ -393,15 +406,17 @@ class PerformanceMonitor:
         Args:
             interval_seconds: Interval between log entries
         """
-        if self.frame_count % (interval_seconds * 60) == 0:  # Assuming ~60 FPS
-            summary = self.get_performance_summary()
-            self.logger.info(
-                f"Performance Summary - "
-                f"FPS: {summary['avg_fps']:.1f}, "
-                f"Frame Time: {summary['avg_frame_time_ms']:.1f}ms, "
-                f"CPU: {summary['avg_cpu_usage']:.1f}%, "
-                f"Memory: {summary['avg_memory_mb']:.1f}MB"
-            )
+        # Assuming ~60 FPS; also skip averaging the histories when INFO is filtered out
+        if (self.frame_count % (interval_seconds * 60) != 0
+                or not self.logger.isEnabledFor(logging.INFO)):
+            return
+        
+        summary = self.get_performance_summary()
+        self.logger.info(
+            "Performance Summary - FPS: %.1f, Frame Time: %.1fms, CPU: %.1f%%, Memory: %.1fMB",
+            summary['avg_fps'], summary['avg_frame_time_ms'],
+            summary['avg_cpu_usage'], summary['avg_memory_mb']
+        )
 
 
 class OptimizedFrameBuffer:
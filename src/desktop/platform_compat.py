@@ -30,10 +30,10 @@ class PlatformCompat:
         """Initialize platform compatibility utilities."""
         self.logger = get_logger()
         self._platform = self._detect_platform()
-        self._platform_info = self._get_platform_info()
+        # Built on first access; platform.processor() can spawn a subprocess
+        self._platform_info = None
         
-        self.logger.debug(f"Detected platform: {self._platform.value}")
-        self.logger.debug(f"Platform info: {self._platform_info}")
+        self.logger.debug("Detected platform: %s", self._platform.value)
     
     def _detect_platform(self) -> Platform:
         """
@@ -51,7 +51,7 @@ class PlatformCompat:
         elif system == "linux":
             return Platform.LINUX
         else:
-            self.logger.warning(f"Unknown platform: {system}")
+            self.logger.warning("Unknown platform: %s", system)
             return Platform.UNKNOWN
     
     def _get_platform_info(self) -> Dict[str, Any]:
@@ -79,6 +79,8 @@ class PlatformCompat:
     @property
     def platform_info(self) -> Dict[str, Any]:
         """Get platform information."""
+        if self._platform_info is None:
+            self._platform_info = self._get_platform_info()
         return self._platform_info.copy()
     
     def is_windows(self) -> bool:
@@ -205,9 +207,9 @@ class PlatformCompat:
         for directory in directories:
             try:
                 directory.mkdir(parents=True, exist_ok=True)
-                self.logger.debug(f"Ensured directory exists: {directory}")
+                self.logger.debug("Ensured directory exists: %s", directory)
             except OSError as e:
-                self.logger.error(f"Failed to create directory {directory}: {e}")
+                self.logger.error("Failed to create directory %s: %s", directory, e)
     
     def get_font_paths(self) -> list[Path]:
         """
@@ -243,7 +245,7 @@ class PlatformCompat:
         
         # Filter to only existing directories
         existing_paths = [path for path in font_paths if path.exists()]
-        self.logger.debug(f"Font search paths: {existing_paths}")
+        self.logger.debug("Font search paths: %s", existing_paths)
         
         return existing_paths
     
@@ -297,7 +299,7 @@ class PlatformCompat:
                 except ValueError:
                     return 1.0
         except Exception as e:
-            self.logger.warning(f"Failed to detect display scaling: {e}")
+            self.logger.warning("Failed to detect display scaling: %s", e)
             return 1.0
     
     def get_window_manager_info(self) -> Dict[str, Any]:
@@ -361,7 +363,7 @@ class PlatformCompat:
         
         for key, value in hints.items():
             os.environ[key] = value
-            self.logger.debug(f"Set {key}={value}")
+            self.logger.debug("Set %s=%s", key, value)
     
     def get_performance_settings(self) -> Dict[str, Any]:
         """
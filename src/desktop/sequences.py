@@ -5,7 +5,7 @@ This module provides desktop-compatible versions of the StepData, Sequence, and
 classes that use standard Python timing functions instead of MicroPython's timing system.
 """
 
-from typing import Callable, List, Optional, Any
+from typing import Callable, List, Optional, Any, Iterable
 from .timing import ticks_ms, ticks_diff
 
 
@@ -60,6 +60,8 @@ class Sequence(list):
     standard Python timing functions.
     """
     
+    __slots__ = ["owner", "name", "_start"]
+    
     def __init__(self, owner: Any, name: str):
         """
         Initialize an animation sequence.
@@ -84,6 +86,26 @@ class Sequence(list):
         step_data = StepData(self, ms_timing, _lambda)
         self.append(step_data)
     
+    def step_group(self, ms_timing: int, _lambdas: Iterable[Callable]) -> None:
+        """
+        Add several actions that share the same timing as a single step.
+        
+        The actions run in the given order when the step triggers. Using one
+        grouped step instead of several same-timed steps keeps the number of
+        scheduled entries (and per-frame timing checks) down.
+        
+        Args:
+            ms_timing: Timing in milliseconds when the actions should execute
+            _lambdas: Functions to execute when the step triggers
+        """
+        actions = tuple(_lambdas)
+        
+        def run_group(owner: Any) -> None:
+            for action in actions:
+                action(owner)
+        
+        self.step(ms_timing, run_group)
+    
     def start(self) -> None:
         """Start the sequence by recording the start time."""
         self._start = ticks_ms()
@@ -114,13 +136,18 @@ class Sequence(list):
             current_ticks: Current time in milliseconds
         """
         # Check if we have to execute a step
-        if self._start is None:
+        start = self._start
+        if start is None:
             return
         
-        # Update all incomplete steps
+        # Run incomplete steps that are due; elapsed time is computed once and
+        # the step's action is called inline rather than through StepData.update
+        elapsed = ticks_diff(current_ticks, start)
+        owner = self.owner
         for step in self:
-            if not step.done:
-                step.update(current_ticks)
+            if not step.done and step.ms_timing <= elapsed:
+                step._lambda(owner)
+                step.done = True
 
 
 class Sequences(list):
@@ -131,6 +158,8 @@ class Sequences(list):
     multiple animation sequences.
     """
     
+    __slots__ = ["owner"]
+    
     def __init__(self, owner: Any):
         """
         Initialize the sequences collection.
@@ -165,8 +194,18 @@ class Sequences(list):
         """
         return all(seq.done for seq in self)
     
-    def update(self) -> None:
-        """Update all sequences and execute any pending steps."""
-        current_ticks = ticks_ms()
+    def update(self, current_ticks: Optional[int] = None) -> None:
+        """
+        Update all sequences and execute any pending steps.
+        
+        Args:
+            current_ticks: Current time in milliseconds; read from the clock if not given
+        """
+        # Nothing registered (the common case): skip reading the clock
+        if not self:
+            return
+        
+        if current_ticks is None:
+            current_ticks = ticks_ms()
         for seq in self:
             seq.update(current_ticks)
\ No newline at end of file
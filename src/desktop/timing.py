@@ -13,12 +13,14 @@ def ticks_ms() -> int:
     """
     Get current time in milliseconds.
     
-    Replacement for MicroPython's time.ticks_ms().
+    Replacement for MicroPython's time.ticks_ms(). Based on the monotonic
+    clock, so values are unaffected by system clock changes and are computed
+    with integer arithmetic only.
     
     Returns:
         Current time in milliseconds as an integer
     """
-    return int(time.time() * 1000)
+    return time.monotonic_ns() // 1_000_000
 
 
 def ticks_diff(ticks1: int, ticks2: int) -> int:
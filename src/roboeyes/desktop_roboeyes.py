@@ -12,6 +12,8 @@ from typing import Optional, Callable, Tuple
 # Import desktop compatibility layers
 import sys
 import os
+import math
+import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from desktop.framebuffer import FrameBufferCompat
@@ -30,6 +32,8 @@ from desktop.logging import get_logger
 
 # Import constants and random from standard library
 from random import randint
+from collections import OrderedDict
+import threading
 import time
 
 # Usage of monochrome display colors
@@ -45,6 +49,48 @@ FROZEN = 4
 SCARY = 5
 CURIOUS = 6
 
+# Bits of DesktopRoboEyes._flags, one per boolean state field
+(_F_CURIOUS, _F_CYCLOPS, _F_CONFUSED, _F_LAUGH, _F_AUTOBLINK, _F_IDLE,
+ _F_HFLICKER, _F_VFLICKER, _F_EYEL_OPEN, _F_EYER_OPEN,
+ _F_TIRED, _F_ANGRY, _F_HAPPY) = (1 << i for i in range(13))
+_F_EYELIDS = _F_TIRED | _F_ANGRY | _F_HAPPY
+_EYELIDS_TOP = _F_TIRED | _F_ANGRY
+_EASING_FLAGS = _F_CURIOUS | _F_CYCLOPS | _F_EYEL_OPEN | _F_EYER_OPEN
+
+# Moods that drive the flicker animations
+_FLICKER_MOODS = frozenset((SCARY, FROZEN))
+
+# Eyelid bits for each mood, all off when not listed
+_MOOD_EYELIDS = {
+    TIRED: _F_TIRED,
+    ANGRY: _F_ANGRY,
+    HAPPY: _F_HAPPY,
+    SCARY: _F_TIRED,
+}
+
+
+def _flag_property(bit, doc):
+    """Boolean property stored as one bit of the instance's _flags."""
+    def getter(self):
+        return bool(self._flags & bit)
+    
+    def setter(self, value):
+        with self._flags_lock:
+            if value:
+                self._flags |= bit
+            else:
+                self._flags &= ~bit
+    
+    return property(getter, setter, doc=doc)
+
+
+# Rendered eye frames kept for reuse by draw_eyes: at most this many, and
+# no more than this many bytes of pixel data in total. Displays too large
+# to fit a few frames in the budget don't cache at all.
+_FRAME_CACHE_SIZE = 128
+_FRAME_CACHE_BYTES = 4 * 1024 * 1024
+_FRAME_CACHE_MIN_FRAMES = 8
+
 # For turning things on or off
 ON = 1
 OFF = 0
@@ -60,6 +106,19 @@ W = 7   # west, middle left
 NW = 8  # north-west, top left 
 # for middle center set "DEFAULT"
 
+# Target of each predefined position in halves of the screen constraint:
+# (x, y) where 0 is left/top, 1 is center and 2 is right/bottom
+_POSITION_HALVES = {
+    N: (1, 0),
+    NE: (2, 0),
+    E: (2, 1),
+    SE: (2, 2),
+    S: (1, 2),
+    SW: (0, 2),
+    W: (0, 1),
+    NW: (0, 0),
+}
+
 
 
 
@@ -72,6 +131,56 @@ class DesktopRoboEyes:
     but uses Pygame for graphics rendering and standard Python timing functions.
     """
     
+    # Fixed per-instance fields; draw_eyes reads most of them every frame.
+    # __dict__ stays available so callers can still patch handle_events.
+    __slots__ = (
+        '_event_handlers', '_eye_rects', '_flags', '_flags_lock',
+        '_frame_cache', '_frame_cache_limit', '_last_frame_key', '_mood',
+        '_position', '_present_key', '_presented', '_scaled_surface',
+        '_settled_state', 'bgcolor', 'blinkInterval', 'blinkIntervalVariation',
+        'blinktimer', 'clock', 'config', 'confusedAnimationDuration',
+        'confusedAnimationTimer', 'confusedToggle', 'display_height',
+        'display_width', 'eyeLborderRadiusCurrent', 'eyeLborderRadiusDefault',
+        'eyeLborderRadiusNext', 'eyeLheightCurrent', 'eyeLheightDefault',
+        'eyeLheightNext', 'eyeLheightOffset', 'eyeLwidthCurrent',
+        'eyeLwidthDefault', 'eyeLwidthNext', 'eyeLx', 'eyeLxDefault',
+        'eyeLxNext', 'eyeLy', 'eyeLyDefault', 'eyeLyNext',
+        'eyeRborderRadiusCurrent', 'eyeRborderRadiusDefault',
+        'eyeRborderRadiusNext', 'eyeRheightCurrent', 'eyeRheightDefault',
+        'eyeRheightNext', 'eyeRheightOffset', 'eyeRwidthCurrent',
+        'eyeRwidthDefault', 'eyeRwidthNext', 'eyeRx', 'eyeRxDefault',
+        'eyeRxNext', 'eyeRy', 'eyeRyDefault', 'eyeRyNext', 'eye_surface',
+        'eyelidsAngryHeight', 'eyelidsAngryHeightNext',
+        'eyelidsHappyBottomOffset', 'eyelidsHappyBottomOffsetMax',
+        'eyelidsHappyBottomOffsetNext', 'eyelidsHeightMax',
+        'eyelidsTiredHeight', 'eyelidsTiredHeightNext', 'fb', 'fgcolor',
+        'fpsTimer', 'frameInterval', 'fullscreen', 'gfx', 'hFlickerAlternate',
+        'hFlickerAmplitude', 'idleAnimationTimer', 'idleInterval',
+        'idleIntervalVariation', 'input_manager', 'laughAnimationDuration',
+        'laughAnimationTimer', 'laughToggle', 'minimized', 'offset_x',
+        'offset_y', 'on_show', 'performance_monitor', 'resizable', 'running',
+        'scale', 'scale_x', 'scale_y', 'scaled_height', 'scaled_width',
+        'screen', 'screenHeight', 'screenWidth', 'sequences',
+        'spaceBetweenCurrent', 'spaceBetweenDefault', 'spaceBetweenNext',
+        'vFlickerAlternate', 'vFlickerAmplitude', 'window_focused',
+        'window_height', 'window_width', '__dict__'
+    )
+    
+    # Boolean state, packed into self._flags
+    _curious = _flag_property(_F_CURIOUS, "Curious mode enabled.")
+    _cyclops = _flag_property(_F_CYCLOPS, "Cyclops mode enabled.")
+    _confused = _flag_property(_F_CONFUSED, "Confused animation pending.")
+    _laugh = _flag_property(_F_LAUGH, "Laugh animation pending.")
+    autoblinker = _flag_property(_F_AUTOBLINK, "Automatic blinking enabled.")
+    idle = _flag_property(_F_IDLE, "Idle repositioning enabled.")
+    hFlicker = _flag_property(_F_HFLICKER, "Horizontal flicker enabled.")
+    vFlicker = _flag_property(_F_VFLICKER, "Vertical flicker enabled.")
+    eyeL_open = _flag_property(_F_EYEL_OPEN, "Left eye should (re)open.")
+    eyeR_open = _flag_property(_F_EYER_OPEN, "Right eye should (re)open.")
+    tired = _flag_property(_F_TIRED, "Tired eyelids shown.")
+    angry = _flag_property(_F_ANGRY, "Angry eyelids shown.")
+    happy = _flag_property(_F_HAPPY, "Happy eyelids shown.")
+    
     def __init__(self, config: Optional[RoboEyesConfig] = None, 
                  width: int = 128, height: int = 64, frame_rate: int = 20, 
                  window_width: int = 800, window_height: int = 600,
@@ -112,8 +221,9 @@ class DesktopRoboEyes:
             if not pygame.get_init():
                 raise PygameInitializationError("Pygame failed to initialize")
                 
-            logger.info(f"Pygame initialized successfully on {platform_compat.platform.value}")
-            logger.debug(f"Platform info: {platform_compat.platform_info}")
+            logger.info("Pygame initialized successfully on %s", platform_compat.platform.value)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Platform info: %s", platform_compat.platform_info)
             
         except pygame.error as e:
             error_msg = f"Pygame initialization failed: {e}"
@@ -160,7 +270,7 @@ class DesktopRoboEyes:
             if self.fullscreen:
                 window_flags |= pygame.FULLSCREEN
             
-            logger.info(f"Creating display window: {self.window_width}x{self.window_height}")
+            logger.info("Creating display window: %sx%s", self.window_width, self.window_height)
             self.screen = pygame.display.set_mode((self.window_width, self.window_height), window_flags)
             pygame.display.set_caption("RoboEyes Desktop")
             
@@ -173,7 +283,7 @@ class DesktopRoboEyes:
         
         try:
             # Create the eye display surface (scaled to fit window)
-            logger.debug(f"Creating eye surface: {self.display_width}x{self.display_height}")
+            logger.debug("Creating eye surface: %dx%d", self.display_width, self.display_height)
             self.eye_surface = pygame.Surface((self.display_width, self.display_height))
             
             # Calculate initial scaling
@@ -203,6 +313,20 @@ class DesktopRoboEyes:
         # Set up the on_show callback to handle display updates
         self.on_show = self._pygame_show
         
+        # Created later in __init__; the first on_show runs before it exists
+        self.input_manager = None
+        
+        # Window-sized copy of the eye surface, reused by _scale_eye_surface
+        self._scaled_surface = None
+        
+        # Eye rectangles of the current frame, and the layout, eye rectangles and frame
+        # key last presented to the display surface; None forces a full flip (see _pygame_show)
+        self._eye_rects = ()
+        self._presented = None
+        
+        # Key of the frame in the eye surface
+        self._last_frame_key = None
+        
         # Initialize the core RoboEyes properties (copied from original)
         self.screenWidth = width
         self.screenHeight = height
@@ -214,6 +338,10 @@ class DesktopRoboEyes:
         
         # Mood and expression properties
         self._mood = DEFAULT
+        # Guards read-modify-write of _flags: moods and animations may be
+        # changed from another thread while run() is drawing
+        self._flags_lock = threading.Lock()
+        self._flags = 0
         self.tired = False
         self.angry = False
         self.happy = False
@@ -285,12 +413,12 @@ class DesktopRoboEyes:
         # Macro Animations
         # Horizontal flicker/shiver
         self.hFlicker = False
-        self.hFlickerAlternate = False
+        self.hFlickerAlternate = 0
         self.hFlickerAmplitude = 2
         
         # Vertical flicker/shiver
         self.vFlicker = False
-        self.vFlickerAlternate = False
+        self.vFlickerAlternate = 0
         self.vFlickerAmplitude = 10
         
         # Auto blinking
@@ -305,6 +433,17 @@ class DesktopRoboEyes:
         self.idleIntervalVariation = 3
         self.idleAnimationTimer = 0
         
+        # Recently rendered frames keyed by their geometry (see draw_eyes),
+        # limited by the memory a copy of the eye surface takes
+        self._frame_cache: 'OrderedDict[Tuple[int, ...], pygame.Surface]' = OrderedDict()
+        frame_bytes = self.display_width * self.display_height * self.eye_surface.get_bytesize()
+        self._frame_cache_limit = min(_FRAME_CACHE_SIZE, _FRAME_CACHE_BYTES // max(frame_bytes, 1))
+        if self._frame_cache_limit < _FRAME_CACHE_MIN_FRAMES:
+            self._frame_cache_limit = 0
+        
+        # Easing state draw_eyes last settled on (see _easing_state)
+        self._settled_state = None
+        
         # Eyes confused
         self._confused = False
         self.confusedAnimationTimer = 0
@@ -330,6 +469,18 @@ class DesktopRoboEyes:
             logger.debug("Initializing input manager...")
             self.input_manager = InputManager(self)
             
+            # Event type -> handler, so unhandled events (mouse motion etc.)
+            # cost a single dict lookup in handle_events
+            self._event_handlers = {
+                pygame.QUIT: self._handle_quit,
+                pygame.VIDEORESIZE: self._handle_resize_event,
+                pygame.ACTIVEEVENT: self._handle_window_focus,
+                pygame.KEYDOWN: self._handle_key_event,
+                pygame.MOUSEBUTTONDOWN: self.input_manager.process_event,
+                pygame.VIDEOEXPOSE: self._handle_expose,
+                pygame.WINDOWEXPOSED: self._handle_expose,
+            }
+            
             # Application state
             self.running = True
             self.clock = pygame.time.Clock()
@@ -358,6 +509,21 @@ class DesktopRoboEyes:
         self.scaled_height = int(self.display_height * self.scale)
         self.offset_x = (self.window_width - self.scaled_width) // 2
         self.offset_y = (self.window_height - self.scaled_height) // 2
+        
+        # Window layout compared by _pygame_show on every frame, built once per change
+        self._present_key = (self.scaled_width, self.scaled_height, self.offset_x, self.offset_y)
+    
+    def _scale_eye_surface(self) -> pygame.Surface:
+        """
+        Scale the eye surface to the window into a reused surface.
+        
+        The destination is only reallocated when the scaled size changes,
+        so presenting a frame does not create a new surface each time.
+        """
+        size = (self.scaled_width, self.scaled_height)
+        if self._scaled_surface is None or self._scaled_surface.get_size() != size:
+            self._scaled_surface = pygame.Surface(size, 0, self.eye_surface)
+        return pygame.transform.scale(self.eye_surface, size, self._scaled_surface)
     
     def _pygame_show(self, roboeyes_instance) -> None:
         """
@@ -373,66 +539,76 @@ class DesktopRoboEyes:
         logger = get_logger()
         
         try:
-            # Skip rendering if window is minimized
+            # Skip rendering if window is minimized; repaint fully once restored
             if self.minimized:
+                self._presented = None
                 return
             
             # Get dirty rectangles for optimized updates
             dirty_rects = self.fb.get_dirty_rects()
             total_pixels_updated = 0
             
-            # Determine update strategy - disable dirty rects for now to fix frame clearing issue
-            use_dirty_rects = False  # Force full screen updates to ensure proper clearing
+            # Only the eye areas of this and the previous frame can differ, as long as
+            # the window layout is unchanged and no overlay is drawn over the frame
+            overlays = self.performance_monitor.show_performance or (
+                self.input_manager is not None and self.input_manager.help_visible)
+            present_key = self._present_key
+            use_dirty_rects = (not overlays and self._presented is not None
+                               and self._presented[0] == present_key)
+            
+            # A frame already on this display surface needs neither a blit nor an update
+            frame_key = self._last_frame_key
+            already_presented = (use_dirty_rects and frame_key is not None
+                                 and self._presented[2] == frame_key)
+            
+            if not use_dirty_rects:
+                # Full screen update (first frame, layout change or overlays shown)
+                scaled_surface = self._scale_eye_surface()
+                
+                # Clear the screen with black background
+                self.screen.fill((0, 0, 0))
+                
+                # Blit the scaled eye surface to the center of the screen
+                self.screen.blit(scaled_surface, (self.offset_x, self.offset_y))
+                
+                # Full screen update
+                pygame.display.flip()
+                total_pixels_updated = self.display_width * self.display_height
             
-            if use_dirty_rects:
-                # Optimized update using dirty rectangles
-                scaled_surface = pygame.transform.scale(self.eye_surface, (self.scaled_width, self.scaled_height))
+            elif not already_presented:
+                # Optimized update using the eye rectangles
+                scaled_surface = self._scale_eye_surface()
+                scaled_bounds = scaled_surface.get_rect()
                 
                 # Update only dirty regions
                 update_rects = []
-                for rect in dirty_rects:
-                    # Scale dirty rectangle to window coordinates
-                    scaled_rect = pygame.Rect(
-                        int(rect.x * self.scale) + self.offset_x,
-                        int(rect.y * self.scale) + self.offset_y,
-                        int(rect.width * self.scale),
-                        int(rect.height * self.scale)
-                    )
-                    
-                    # Clear the region with black background
-                    self.screen.fill((0, 0, 0), scaled_rect)
-                    
-                    # Blit the corresponding region from the scaled surface
+                for rect in self._presented[1] + self._eye_rects:
+                    # Scale eye rectangle to the scaled surface, rounding outwards
+                    left = int(rect.x * self.scale)
+                    top = int(rect.y * self.scale)
                     source_rect = pygame.Rect(
-                        int(rect.x * self.scale),
-                        int(rect.y * self.scale),
-                        int(rect.width * self.scale),
-                        int(rect.height * self.scale)
-                    )
+                        left,
+                        top,
+                        math.ceil(rect.right * self.scale) - left,
+                        math.ceil(rect.bottom * self.scale) - top
+                    ).clip(scaled_bounds)
+                    if not source_rect:
+                        continue
                     
+                    # Blit the corresponding region from the scaled surface
+                    scaled_rect = source_rect.move(self.offset_x, self.offset_y)
                     self.screen.blit(scaled_surface, scaled_rect, source_rect)
                     update_rects.append(scaled_rect)
                     total_pixels_updated += rect.width * rect.height
                 
                 # Update only the dirty regions
                 pygame.display.update(update_rects)
-                
-            else:
-                # Full screen update (fallback for large changes)
-                scaled_surface = pygame.transform.scale(self.eye_surface, (self.scaled_width, self.scaled_height))
-                
-                # Clear the screen with black background
-                self.screen.fill((0, 0, 0))
-                
-                # Blit the scaled eye surface to the center of the screen
-                self.screen.blit(scaled_surface, (self.offset_x, self.offset_y))
-                
-                # Full screen update
-                pygame.display.flip()
-                total_pixels_updated = self.display_width * self.display_height
+            
+            # Overlays are drawn straight onto the window, so the frame after them is presented in full
+            self._presented = None if overlays else (present_key, self._eye_rects, frame_key)
             
             # Render help overlay if visible (only if input_manager is initialized)
-            if hasattr(self, 'input_manager'):
+            if self.input_manager is not None:
                 self.input_manager.render_help(self.screen)
             
             # Update performance metrics
@@ -448,10 +624,12 @@ class DesktopRoboEyes:
             self.performance_monitor.log_performance_summary()
             
         except pygame.error as e:
-            logger.error(f"Pygame error during display update: {e}")
+            self._presented = None
+            logger.error("Pygame error during display update: %s", e)
             # Don't re-raise to keep the application running
         except Exception as e:
-            logger.error(f"Unexpected error during display update: {e}")
+            self._presented = None
+            logger.error("Unexpected error during display update: %s", e)
             # Don't re-raise to keep the application running
     
     def handle_events(self) -> None:
@@ -459,30 +637,60 @@ class DesktopRoboEyes:
         logger = get_logger()
         
         try:
+            event_handlers = self._event_handlers
             for event in pygame.event.get():
                 try:
-                    if event.type == pygame.QUIT:
-                        logger.info("Quit event received")
-                        self.running = False
-                    elif event.type == pygame.VIDEORESIZE:
-                        self._handle_window_resize(event.w, event.h)
-                    elif event.type == pygame.ACTIVEEVENT:
-                        self._handle_window_focus(event)
-                    elif event.type == pygame.KEYDOWN:
-                        # Try input manager first, then fallback to window management
-                        if not self.input_manager.process_event(event):
-                            self._handle_keydown(event)
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        self.input_manager.process_event(event)
+                    handler = event_handlers.get(event.type)
+                    if handler is not None:
+                        handler(event)
                 except Exception as e:
-                    logger.error(f"Error handling event {event.type}: {e}")
+                    logger.error("Error handling event %s: %s", event.type, e)
                     # Continue processing other events
                     continue
                     
         except pygame.error as e:
-            logger.error(f"Pygame error in event handling: {e}")
+            logger.error("Pygame error in event handling: %s", e)
         except Exception as e:
-            logger.exception(f"Unexpected error in event handling: {e}")
+            logger.exception("Unexpected error in event handling: %s", e)
+    
+    def _handle_quit(self, event) -> None:
+        """
+        Handle the window close request.
+        
+        Args:
+            event: Pygame QUIT event
+        """
+        get_logger().info("Quit event received")
+        self.running = False
+    
+    def _handle_resize_event(self, event) -> None:
+        """
+        Handle a window resize event.
+        
+        Args:
+            event: Pygame VIDEORESIZE event
+        """
+        self._handle_window_resize(event.w, event.h)
+    
+    def _handle_expose(self, event) -> None:
+        """
+        Handle the window contents being exposed and needing a repaint.
+        
+        Args:
+            event: Pygame VIDEOEXPOSE or WINDOWEXPOSED event
+        """
+        self._presented = None
+    
+    def _handle_key_event(self, event) -> None:
+        """
+        Handle a key press.
+        
+        Args:
+            event: Pygame KEYDOWN event
+        """
+        # Try input manager first, then fallback to window management
+        if not self.input_manager.process_event(event):
+            self._handle_keydown(event)
     
     def _handle_window_resize(self, new_width: int, new_height: int) -> None:
         """
@@ -499,11 +707,11 @@ class DesktopRoboEyes:
                 logger.debug("Window resize ignored - resizing disabled")
                 return
             
-            logger.debug(f"Handling window resize: {new_width}x{new_height}")
+            logger.debug("Handling window resize: %dx%d", new_width, new_height)
             
             # Validate new dimensions
             if new_width < 100 or new_height < 100:
-                logger.warning(f"Window resize dimensions too small: {new_width}x{new_height}")
+                logger.warning("Window resize dimensions too small: %sx%s", new_width, new_height)
                 return
                 
             # Update window dimensions
@@ -518,11 +726,12 @@ class DesktopRoboEyes:
                 window_flags |= pygame.FULLSCREEN
                 
             self.screen = pygame.display.set_mode((new_width, new_height), window_flags)
+            self._presented = None  # new display surface, present the next frame in full
             
             # Recalculate scaling
             self._calculate_scaling()
             
-            logger.debug(f"Window resized successfully to {new_width}x{new_height}")
+            logger.debug("Window resized successfully to %dx%d", new_width, new_height)
             
         except pygame.error as e:
             error_msg = f"Pygame error during window resize: {e}"
@@ -543,7 +752,11 @@ class DesktopRoboEyes:
         if event.state == 1:  # Window focus/unfocus
             self.window_focused = bool(event.gain)
         elif event.state == 2:  # Window minimize/restore
-            self.minimized = not bool(event.gain)
+            minimized = not bool(event.gain)
+            if minimized != self.minimized:
+                # The window contents are lost; present the next frame in full
+                self._presented = None
+            self.minimized = minimized
     
     def _handle_keydown(self, event) -> None:
         """
@@ -578,6 +791,9 @@ class DesktopRoboEyes:
             self.window_width = 800
             self.window_height = 600
         
+        # New display surface, present the next frame in full
+        self._presented = None
+        
         # Recalculate scaling for new window size
         self._calculate_scaling()
     
@@ -676,23 +892,27 @@ class DesktopRoboEyes:
         logger.info("Starting RoboEyes main loop")
         
         try:
+            # Bound once; looked up on every loop iteration otherwise.
+            # handle_events is read per iteration since callers may replace it.
+            update = self.update
+            tick = self.clock.tick
             while self.running:
                 try:
                     self.handle_events()
-                    self.update()
-                    self.clock.tick(60)  # Limit to 60 FPS for smooth window handling
+                    update()
+                    tick(60)  # Limit to 60 FPS for smooth window handling
                 except KeyboardInterrupt:
                     logger.info("Keyboard interrupt received, shutting down")
                     self.running = False
                 except Exception as e:
-                    logger.error(f"Error in main loop: {e}")
+                    logger.error("Error in main loop: %s", e)
                     # Continue running unless it's a critical error
                     if isinstance(e, (DisplayError, PygameInitializationError)):
                         logger.critical("Critical error, shutting down")
                         self.running = False
                     
         except Exception as e:
-            logger.exception(f"Fatal error in main loop: {e}")
+            logger.exception("Fatal error in main loop: %s", e)
         finally:
             logger.info("Shutting down RoboEyes")
             self._cleanup()
@@ -706,7 +926,7 @@ class DesktopRoboEyes:
             pygame.quit()
             logger.info("RoboEyes shutdown complete")
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
         finally:
             sys.exit()
     
@@ -717,15 +937,16 @@ class DesktopRoboEyes:
         logger = get_logger()
         
         try:
-            self.sequences.update()
+            # One clock read per tick, shared by the sequences and the frame limiter
+            now = ticks_ms()
+            self.sequences.update(now)
             # Limit drawing updates to defined max framerate
-            if ticks_diff(ticks_ms(), self.fpsTimer) >= self.frameInterval:
-                # Clear display before drawing to ensure clean frame
-                self.clear_display()
+            if ticks_diff(now, self.fpsTimer) >= self.frameInterval:
+                # draw_eyes clears the buffer itself when it has to redraw
                 self.draw_eyes()
-                self.fpsTimer = ticks_ms()
+                self.fpsTimer = now
         except Exception as e:
-            logger.error(f"Error in animation update: {e}")
+            logger.error("Error in animation update: %s", e)
             # Don't re-raise to keep the application running
     
     def clear_display(self):
@@ -777,46 +998,23 @@ class DesktopRoboEyes:
     def mood(self, mood):
         """Set mood expression."""
         # Handle mood transitions
-        if (self._mood in (SCARY, FROZEN)) and not(mood in (SCARY, FROZEN)):
+        if (self._mood in _FLICKER_MOODS) and not(mood in _FLICKER_MOODS):
             self.horiz_flicker(False)
             self.vert_flicker(False)
         
         if self._curious and (mood != CURIOUS):
             self._curious = False
         
-        if mood == TIRED:
-            self.tired = True
-            self.angry = False
-            self.happy = False
-        elif mood == ANGRY:
-            self.tired = False
-            self.angry = True
-            self.happy = False
-        elif mood == HAPPY:
-            self.tired = False
-            self.angry = False
-            self.happy = True
-        elif mood == FROZEN:
-            self.tired = False
-            self.angry = False
-            self.happy = False
+        with self._flags_lock:
+            self._flags = (self._flags & ~_F_EYELIDS) | _MOOD_EYELIDS.get(mood, 0)
+        if mood == FROZEN:
             self.horiz_flicker(True, 2)
             self.vert_flicker(False)
         elif mood == SCARY:
-            self.tired = True
-            self.angry = False
-            self.happy = False
             self.horiz_flicker(False)
             self.vert_flicker(True, 2)
         elif mood == CURIOUS:
-            self.tired = False
-            self.angry = False
-            self.happy = False
             self._curious = True
-        else:
-            self.tired = False
-            self.angry = False
-            self.happy = False
         self._mood = mood
     
     def set_mood(self, value):
@@ -831,33 +1029,10 @@ class DesktopRoboEyes:
     @position.setter
     def position(self, direction):
         """Set predefined position."""
-        if direction == N:  # North, top center
-            self.eyeLxNext = self.get_screen_constraint_X()//2
-            self.eyeLyNext = 0
-        elif direction == NE:  # North-east, top right
-            self.eyeLxNext = self.get_screen_constraint_X()
-            self.eyeLyNext = 0
-        elif direction == E:  # East, middle right
-            self.eyeLxNext = self.get_screen_constraint_X()
-            self.eyeLyNext = self.get_screen_constraint_Y()//2
-        elif direction == SE:  # South-east, bottom right
-            self.eyeLxNext = self.get_screen_constraint_X()
-            self.eyeLyNext = self.get_screen_constraint_Y()
-        elif direction == S:  # South, bottom center
-            self.eyeLxNext = self.get_screen_constraint_X()//2
-            self.eyeLyNext = self.get_screen_constraint_Y()
-        elif direction == SW:  # South-west, bottom left
-            self.eyeLxNext = 0
-            self.eyeLyNext = self.get_screen_constraint_Y()
-        elif direction == W:  # West, middle left
-            self.eyeLxNext = 0
-            self.eyeLyNext = self.get_screen_constraint_Y()//2
-        elif direction == NW:  # North-west, top left
-            self.eyeLxNext = 0
-            self.eyeLyNext = 0
-        else:  # Middle center
-            self.eyeLxNext = self.get_screen_constraint_X()//2
-            self.eyeLyNext = self.get_screen_constraint_Y()//2
+        # Unknown directions (including DEFAULT) center the eyes
+        half_x, half_y = _POSITION_HALVES.get(direction, (1, 1))
+        self.eyeLxNext = self.get_screen_constraint_X()*half_x//2
+        self.eyeLyNext = self.get_screen_constraint_Y()*half_y//2
         self._position = direction
     
     def set_position(self, value):
@@ -978,6 +1153,18 @@ class DesktopRoboEyes:
         self.idle = False
         self.blink(left=left, right=right)
     
+    def _easing_state(self):
+        """Snapshot of every field the draw_eyes easing reads or writes."""
+        return (self._flags & _EASING_FLAGS, self.screenWidth, self.screenHeight,
+                self.eyeLwidthCurrent, self.eyeLwidthNext, self.eyeRwidthCurrent, self.eyeRwidthNext,
+                self.eyeLheightCurrent, self.eyeLheightNext, self.eyeLheightDefault, self.eyeLheightOffset,
+                self.eyeRheightCurrent, self.eyeRheightNext, self.eyeRheightDefault, self.eyeRheightOffset,
+                self.eyeLborderRadiusCurrent, self.eyeLborderRadiusNext,
+                self.eyeRborderRadiusCurrent, self.eyeRborderRadiusNext,
+                self.spaceBetweenCurrent, self.spaceBetweenNext,
+                self.eyeLx, self.eyeLy, self.eyeLxNext, self.eyeLyNext,
+                self.eyeRx, self.eyeRy, self.eyeRxNext, self.eyeRyNext)
+    
     def draw_eyes(self):
         """
         Draw the eyes with all animations and expressions.
@@ -987,176 +1174,245 @@ class DesktopRoboEyes:
         """
         # PRE-CALCULATIONS - EYE SIZES AND VALUES FOR ANIMATION TWEENINGS
         
-        # Vertical size offset for larger eyes when looking left or right (curious gaze)
-        if self._curious:
-            if self.eyeLxNext <= 10:
-                self.eyeLheightOffset = 8
-            elif (self.eyeLxNext >= self.get_screen_constraint_X()-10) and self._cyclops:
-                self.eyeLheightOffset = 8
-            else:
-                self.eyeLheightOffset = 0  # left eye
+        flags = self._flags  # boolean state bits, see _flag_property
+        
+        # Skip the easing while its inputs match a state it has already settled on
+        state = self._easing_state()
+        if state != self._settled_state:
+            # Vertical size offset for larger eyes when looking left or right (curious gaze)
+            curious = flags & _F_CURIOUS
+            l_x_next = self.eyeLxNext
+            l_gazing = (l_x_next <= 10) or (flags & _F_CYCLOPS and l_x_next >= self.get_screen_constraint_X()-10)
+            r_gazing = self.eyeRxNext >= (self.screenWidth-self.eyeRwidthCurrent-10)
+            l_height_offset = 8 if (curious and l_gazing) else 0
+            r_height_offset = 8 if (curious and r_gazing) else 0
+            self.eyeLheightOffset = l_height_offset
+            self.eyeRheightOffset = r_height_offset
+        
+            # Work on local copies of the geometry and write it back once below
+            l_y_next = self.eyeLyNext
+        
+            # Left eye height
+            l_height = (self.eyeLheightCurrent + self.eyeLheightNext + l_height_offset) >> 1
+            l_y = self.eyeLy + ((self.eyeLheightDefault-l_height) >> 1)  # vertical centering of eye when closing
+            l_y -= l_height_offset >> 1
+            # Right eye height
+            r_height = (self.eyeRheightCurrent + self.eyeRheightNext + r_height_offset) >> 1
+            r_y = self.eyeRy + ((self.eyeRheightDefault-r_height) >> 1)  # vertical centering of eye when closing
+            r_y -= r_height_offset >> 1
+        
+            # Open eyes again after closing them
+            if flags & _F_EYEL_OPEN:
+                if l_height <= (1 + l_height_offset):
+                    self.eyeLheightNext = self.eyeLheightDefault
+        
+            if flags & _F_EYER_OPEN:
+                if r_height <= (1 + r_height_offset):
+                    self.eyeRheightNext = self.eyeRheightDefault
+        
+            # Left eye width
+            l_width = (self.eyeLwidthCurrent + self.eyeLwidthNext) >> 1
+            # Right eye width
+            r_width = (self.eyeRwidthCurrent + self.eyeRwidthNext) >> 1
+        
+            # Space between eyes
+            space_between = (self.spaceBetweenCurrent + self.spaceBetweenNext) >> 1
+        
+            # Left eye coordinates
+            l_x = (self.eyeLx + l_x_next) >> 1
+            l_y = (l_y + l_y_next) >> 1
+            # Right eye coordinates
+            r_x_next = l_x_next+l_width+space_between  # right eye's x position depends on left eyes position + the space between
+            r_y_next = l_y_next  # right eye's y position should be the same as for the left eye
+            r_x = (self.eyeRx + r_x_next) >> 1
+            r_y = (r_y + r_y_next) >> 1
+        
+            # Left eye border radius
+            self.eyeLborderRadiusCurrent = (self.eyeLborderRadiusCurrent + self.eyeLborderRadiusNext) >> 1
+            # Right eye border radius
+            self.eyeRborderRadiusCurrent = (self.eyeRborderRadiusCurrent + self.eyeRborderRadiusNext) >> 1
+        
+            # Write the eased geometry back
+            self.eyeLheightCurrent = l_height
+            self.eyeRheightCurrent = r_height
+            self.eyeLwidthCurrent = l_width
+            self.eyeRwidthCurrent = r_width
+            self.spaceBetweenCurrent = space_between
+            self.eyeLx = l_x
+            self.eyeLy = l_y
+            self.eyeRxNext = r_x_next
+            self.eyeRyNext = r_y_next
+            self.eyeRx = r_x
+            self.eyeRy = r_y
+        
+            # Screen constraints for this frame, computed once after the size easing
+            # from the eased locals (same as get_screen_constraint_X/Y)
+            constraint_x = self.screenWidth-l_width-space_between-r_width
+            constraint_y = self.screenHeight-self.eyeLheightDefault
             
-            if self.eyeRxNext >= (self.screenWidth-self.eyeRwidthCurrent-10):
-                self.eyeRheightOffset = 8
-            else:
-                self.eyeRheightOffset = 0  # right eye
+            # Nothing moved this frame: the easing has settled on its targets
+            if self._easing_state() == state:
+                self._settled_state = state
         else:
-            self.eyeLheightOffset = 0  # reset height offset for left eye
-            self.eyeRheightOffset = 0  # reset height offset for right eye
-        
-        # Left eye height
-        self.eyeLheightCurrent = (self.eyeLheightCurrent + self.eyeLheightNext + self.eyeLheightOffset)//2
-        self.eyeLy += (self.eyeLheightDefault-self.eyeLheightCurrent)//2  # vertical centering of eye when closing
-        self.eyeLy -= self.eyeLheightOffset//2
-        # Right eye height
-        self.eyeRheightCurrent = (self.eyeRheightCurrent + self.eyeRheightNext + self.eyeRheightOffset)//2
-        self.eyeRy += (self.eyeRheightDefault-self.eyeRheightCurrent)//2  # vertical centering of eye when closing
-        self.eyeRy -= self.eyeRheightOffset//2
-        
-        # Open eyes again after closing them
-        if self.eyeL_open:
-            if self.eyeLheightCurrent <= (1 + self.eyeLheightOffset):
-                self.eyeLheightNext = self.eyeLheightDefault
-        
-        if self.eyeR_open:
-            if self.eyeRheightCurrent <= (1 + self.eyeRheightOffset):
-                self.eyeRheightNext = self.eyeRheightDefault
-        
-        # Left eye width
-        self.eyeLwidthCurrent = (self.eyeLwidthCurrent + self.eyeLwidthNext)//2
-        # Right eye width
-        self.eyeRwidthCurrent = (self.eyeRwidthCurrent + self.eyeRwidthNext)//2
-        
-        # Space between eyes
-        self.spaceBetweenCurrent = (self.spaceBetweenCurrent + self.spaceBetweenNext)//2
-        
-        # Left eye coordinates
-        self.eyeLx = (self.eyeLx + self.eyeLxNext)//2
-        self.eyeLy = (self.eyeLy + self.eyeLyNext)//2
-        # Right eye coordinates
-        self.eyeRxNext = self.eyeLxNext+self.eyeLwidthCurrent+self.spaceBetweenCurrent  # right eye's x position depends on left eyes position + the space between
-        self.eyeRyNext = self.eyeLyNext  # right eye's y position should be the same as for the left eye
-        self.eyeRx = (self.eyeRx + self.eyeRxNext)//2
-        self.eyeRy = (self.eyeRy + self.eyeRyNext)//2
-        
-        # Left eye border radius
-        self.eyeLborderRadiusCurrent = (self.eyeLborderRadiusCurrent + self.eyeLborderRadiusNext)//2
-        # Right eye border radius
-        self.eyeRborderRadiusCurrent = (self.eyeRborderRadiusCurrent + self.eyeRborderRadiusNext)//2
+            constraint_x = self.get_screen_constraint_X()
+            constraint_y = self.get_screen_constraint_Y()
         
         # APPLYING MACRO ANIMATIONS
         
-        if self.autoblinker:
-            if ticks_diff(ticks_ms(), self.blinktimer) >= 0:
+        # Read the clock once so every macro animation sees the same frame time
+        now = ticks_ms()
+        
+        if flags & _F_AUTOBLINK:
+            if ticks_diff(now, self.blinktimer) >= 0:
                 self.blink()
-                self.blinktimer = ticks_add(ticks_ms(), (self.blinkInterval*1000)+(randint(0, self.blinkIntervalVariation)*1000))  # calculate next time for blinking
+                self.blinktimer = ticks_add(now, (self.blinkInterval*1000)+(randint(0, self.blinkIntervalVariation)*1000))  # calculate next time for blinking
         
         # Laughing - eyes shaking up and down for the duration defined by laughAnimationDuration (default = 500ms)
-        if self._laugh:
+        if flags & _F_LAUGH:
             if self.laughToggle:
                 self.vert_flicker(1, 5)
-                self.laughAnimationTimer = ticks_ms()
+                self.laughAnimationTimer = now
                 self.laughToggle = False
-            elif ticks_diff(ticks_ms(), self.laughAnimationTimer) >= self.laughAnimationDuration:
-                self.vert_flicker(0, 0)
-                self.laughToggle = True
-                self._laugh = False
+            elif ticks_diff(now, self.laughAnimationTimer) >= self.laughAnimationDuration:
+                # End the laugh: vertical flicker and laugh bits cleared in one store
+                with self._flags_lock:
+                    self._flags &= ~(_F_VFLICKER | _F_LAUGH)
+                self.vFlickerAmplitude, self.laughToggle = 0, True
         
         # Confused - eyes shaking left and right for the duration defined by confusedAnimationDuration (default = 500ms)
-        if self._confused:
+        if flags & _F_CONFUSED:
             if self.confusedToggle:
                 self.horiz_flicker(1, 20)
-                self.confusedAnimationTimer = ticks_ms()
+                self.confusedAnimationTimer = now
                 self.confusedToggle = False
-            elif ticks_diff(ticks_ms(), self.confusedAnimationTimer) >= self.confusedAnimationDuration:
-                self.horiz_flicker(0, 0)
-                self.confusedToggle = True
-                self._confused = False
+            elif ticks_diff(now, self.confusedAnimationTimer) >= self.confusedAnimationDuration:
+                # End the confusion: horizontal flicker and confused bits cleared in one store
+                with self._flags_lock:
+                    self._flags &= ~(_F_HFLICKER | _F_CONFUSED)
+                self.hFlickerAmplitude, self.confusedToggle = 0, True
         
         # Idle - eyes moving to random positions on screen
-        if self.idle:
-            if ticks_diff(ticks_ms(), self.idleAnimationTimer) >= 0:
-                self.eyeLxNext = randint(0, self.get_screen_constraint_X())
-                self.eyeLyNext = randint(0, self.get_screen_constraint_Y())
-                self.idleAnimationTimer = ticks_add(ticks_ms(), (self.idleInterval*1000)+(randint(0, self.idleIntervalVariation)*1000))  # calculate next time for eyes repositioning
+        if flags & _F_IDLE:
+            if ticks_diff(now, self.idleAnimationTimer) >= 0:
+                self.eyeLxNext = randint(0, constraint_x)
+                self.eyeLyNext = randint(0, constraint_y)
+                self.idleAnimationTimer = ticks_add(now, (self.idleInterval*1000)+(randint(0, self.idleIntervalVariation)*1000))  # calculate next time for eyes repositioning
+        
+        # Laughing and confused may have switched the flickers above
+        flags = self._flags
         
         # Adding offsets for horizontal flickering/shivering
-        if self.hFlicker:
-            if self.hFlickerAlternate:
-                self.eyeLx += self.hFlickerAmplitude
-                self.eyeRx += self.hFlickerAmplitude
-            else:
-                self.eyeLx -= self.hFlickerAmplitude
-                self.eyeRx -= self.hFlickerAmplitude
-            self.hFlickerAlternate = not(self.hFlickerAlternate)
+        if flags & _F_HFLICKER:
+            offset = (2*self.hFlickerAlternate - 1)*self.hFlickerAmplitude  # +amplitude on alternate frames, -amplitude otherwise
+            self.eyeLx += offset
+            self.eyeRx += offset
+            self.hFlickerAlternate ^= 1
         
         # Adding offsets for vertical flickering/shivering
-        if self.vFlicker:
-            if self.vFlickerAlternate:
-                self.eyeLy += self.vFlickerAmplitude
-                self.eyeRy += self.vFlickerAmplitude
-            else:
-                self.eyeLy -= self.vFlickerAmplitude
-                self.eyeRy -= self.vFlickerAmplitude
-            
-            self.vFlickerAlternate = not(self.vFlickerAlternate)
+        if flags & _F_VFLICKER:
+            offset = (2*self.vFlickerAlternate - 1)*self.vFlickerAmplitude  # +amplitude on alternate frames, -amplitude otherwise
+            self.eyeLy += offset
+            self.eyeRy += offset
+            self.vFlickerAlternate ^= 1
         
         # Cyclops mode, set second eye's size and space between to 0
-        if self._cyclops:
+        if flags & _F_CYCLOPS:
             self.eyeRwidthCurrent = 0
             self.eyeRheightCurrent = 0
             self.spaceBetweenCurrent = 0
         
-        # ACTUAL DRAWINGS
-        
-        # Draw basic eye rectangles
-        self.gfx.fill_rrect(self.eyeLx, self.eyeLy, self.eyeLwidthCurrent, self.eyeLheightCurrent, self.eyeLborderRadiusCurrent, self.fgcolor)  # left eye
-        
-        if not self._cyclops:
-            self.gfx.fill_rrect(self.eyeRx, self.eyeRy, self.eyeRwidthCurrent, self.eyeRheightCurrent, self.eyeRborderRadiusCurrent, self.fgcolor)  # right eye
-        
-        # Prepare mood type transitions
-        if self.tired:
-            self.eyelidsTiredHeightNext = self.eyeLheightCurrent//2
-            self.eyelidsAngryHeightNext = 0
-        else:
-            self.eyelidsTiredHeightNext = 0
-        if self.angry:
-            self.eyelidsAngryHeightNext = self.eyeLheightCurrent//2
-            self.eyelidsTiredHeightNext = 0
-        else:
-            self.eyelidsAngryHeightNext = 0
-        if self.happy:
-            self.eyelidsHappyBottomOffsetNext = self.eyeLheightCurrent//2
-        else:
-            self.eyelidsHappyBottomOffsetNext = 0
-        
-        # Draw tired top eyelids
-        self.eyelidsTiredHeight = (self.eyelidsTiredHeight + self.eyelidsTiredHeightNext)//2
-        if not self._cyclops:
-            self.gfx.fill_triangle(self.eyeLx, self.eyeLy-1, self.eyeLx+self.eyeLwidthCurrent, self.eyeLy-1, self.eyeLx, self.eyeLy+self.eyelidsTiredHeight-1, self.bgcolor)  # left eye
-            self.gfx.fill_triangle(self.eyeRx, self.eyeRy-1, self.eyeRx+self.eyeRwidthCurrent, self.eyeRy-1, self.eyeRx+self.eyeRwidthCurrent, self.eyeRy+self.eyelidsTiredHeight-1, self.bgcolor)  # right eye
-        else:
-            # Cyclops tired eyelids
-            self.gfx.fill_triangle(self.eyeLx, self.eyeLy-1, self.eyeLx+(self.eyeLwidthCurrent//2), self.eyeLy-1, self.eyeLx, self.eyeLy+self.eyelidsTiredHeight-1, self.bgcolor)  # left eyelid half
-            self.gfx.fill_triangle(self.eyeLx+(self.eyeLwidthCurrent//2), self.eyeLy-1, self.eyeLx+self.eyeLwidthCurrent, self.eyeLy-1, self.eyeLx+self.eyeLwidthCurrent, self.eyeLy+self.eyelidsTiredHeight-1, self.bgcolor)  # right eyelid half
-        
-        # Draw angry top eyelids
-        self.eyelidsAngryHeight = (self.eyelidsAngryHeight + self.eyelidsAngryHeightNext)//2
-        if not self._cyclops:
-            self.gfx.fill_triangle(self.eyeLx, self.eyeLy-1, self.eyeLx+self.eyeLwidthCurrent, self.eyeLy-1, self.eyeLx+self.eyeLwidthCurrent, self.eyeLy+self.eyelidsAngryHeight-1, self.bgcolor)  # left eye
-            self.gfx.fill_triangle(self.eyeRx, self.eyeRy-1, self.eyeRx+self.eyeRwidthCurrent, self.eyeRy-1, self.eyeRx, self.eyeRy+self.eyelidsAngryHeight-1, self.bgcolor)  # right eye
+        # Prepare mood type transitions (angry eyelids take priority over tired ones)
+        eyelid_height = self.eyeLheightCurrent >> 1
+        self.eyelidsAngryHeightNext = eyelid_height if flags & _F_ANGRY else 0
+        self.eyelidsTiredHeightNext = eyelid_height if (flags & _EYELIDS_TOP) == _F_TIRED else 0
+        self.eyelidsHappyBottomOffsetNext = eyelid_height if flags & _F_HAPPY else 0
+        
+        # Ease all three eyelids towards their targets in one step
+        self.eyelidsTiredHeight, self.eyelidsAngryHeight, self.eyelidsHappyBottomOffset = (
+            (self.eyelidsTiredHeight + self.eyelidsTiredHeightNext) >> 1,
+            (self.eyelidsAngryHeight + self.eyelidsAngryHeightNext) >> 1,
+            (self.eyelidsHappyBottomOffset + self.eyelidsHappyBottomOffsetNext) >> 1,
+        )
+        
+        # Final geometry for this frame, bound once for the key and the draw calls
+        lx, ly, lw, lh, lr = self.eyeLx, self.eyeLy, self.eyeLwidthCurrent, self.eyeLheightCurrent, self.eyeLborderRadiusCurrent
+        rx, ry, rw, rh, rr = self.eyeRx, self.eyeRy, self.eyeRwidthCurrent, self.eyeRheightCurrent, self.eyeRborderRadiusCurrent
+        tired_h, angry_h, happy_off = self.eyelidsTiredHeight, self.eyelidsAngryHeight, self.eyelidsHappyBottomOffset
+        gfx, bg, fg, cyclops = self.gfx, self.bgcolor, self.fgcolor, flags & _F_CYCLOPS
+        mid_x = lx + (lw >> 1)  # split point of the cyclops eyelid halves
+        
+        # Areas the eyes cover this frame, for the partial display update
+        if cyclops:
+            self._eye_rects = (pygame.Rect(lx-1, ly-1, lw+2, lh+2),)
         else:
-            # Cyclops angry eyelids
-            self.gfx.fill_triangle(self.eyeLx, self.eyeLy-1, self.eyeLx+(self.eyeLwidthCurrent//2), self.eyeLy-1, self.eyeLx+(self.eyeLwidthCurrent//2), self.eyeLy+self.eyelidsAngryHeight-1, self.bgcolor)  # left eyelid half
-            self.gfx.fill_triangle(self.eyeLx+(self.eyeLwidthCurrent//2), self.eyeLy-1, self.eyeLx+self.eyeLwidthCurrent, self.eyeLy-1, self.eyeLx+(self.eyeLwidthCurrent//2), self.eyeLy+self.eyelidsAngryHeight-1, self.bgcolor)  # right eyelid half
-        
-        # Draw happy bottom eyelids
-        self.eyelidsHappyBottomOffset = (self.eyelidsHappyBottomOffset + self.eyelidsHappyBottomOffsetNext)//2
-        self.gfx.fill_rrect(self.eyeLx-1, (self.eyeLy+self.eyeLheightCurrent)-self.eyelidsHappyBottomOffset+1, self.eyeLwidthCurrent+2, self.eyeLheightDefault, self.eyeLborderRadiusCurrent, self.bgcolor)  # left eye
-        if not self._cyclops:
-            self.gfx.fill_rrect(self.eyeRx-1, (self.eyeRy+self.eyeRheightCurrent)-self.eyelidsHappyBottomOffset+1, self.eyeRwidthCurrent+2, self.eyeRheightDefault, self.eyeRborderRadiusCurrent, self.bgcolor)  # right eye
-        
+            self._eye_rects = (pygame.Rect(lx-1, ly-1, lw+2, lh+2), pygame.Rect(rx-1, ry-1, rw+2, rh+2))
+        
+        # Nothing is visible while minimized: the animation state above keeps
+        # advancing, but drawing waits until the window is restored
+        if self.minimized:
+            self._last_frame_key = None
+            return
+        
+        # Reuse an identical recent frame instead of redrawing it
+        frame_key = (lx, ly, lw, lh, lr, self.eyeLheightDefault,
+                     rx, ry, rw, rh, rr, self.eyeRheightDefault,
+                     tired_h, angry_h, happy_off, cyclops, fg, bg)
+        
+        # The eye surface still holds the previous frame, so an identical one needs no work
+        frame_unchanged = frame_key == self._last_frame_key
+        self._last_frame_key = frame_key
+        if not frame_unchanged:
+            frame_cache = self._frame_cache
+            cached_frame = frame_cache.get(frame_key)
+            if cached_frame is not None:
+                frame_cache.move_to_end(frame_key)
+                self.eye_surface.blit(cached_frame, (0, 0))
+                self.fb.mark_dirty_rect(0, 0, self.screenWidth, self.screenHeight)
+            else:
+                # Clear display before drawing to ensure clean frame
+                self.clear_display()
+                
+                # ACTUAL DRAWINGS
+                
+                # Draw basic eye rectangles
+                gfx.fill_rrect(lx, ly, lw, lh, lr, fg)  # left eye
+                
+                if not cyclops:
+                    gfx.fill_rrect(rx, ry, rw, rh, rr, fg)  # right eye
+                
+                # Eyelid overlays only erase parts of their own eye, so they are skipped
+                # while all retracted. Overlapping eyes (negative space between them) keep
+                # the full draw order, as a retracted overlay still covers the other eye.
+                eyes_overlap = not cyclops and rx <= lx + lw + 2
+                if tired_h or angry_h or happy_off or eyes_overlap:
+                    # Draw tired top eyelids
+                    if not cyclops:
+                        gfx.fill_triangle(lx, ly-1, lx+lw, ly-1, lx, ly+tired_h-1, bg)  # left eye
+                        gfx.fill_triangle(rx, ry-1, rx+rw, ry-1, rx+rw, ry+tired_h-1, bg)  # right eye
+                    else:
+                        # Cyclops tired eyelids
+                        gfx.fill_triangle(lx, ly-1, mid_x, ly-1, lx, ly+tired_h-1, bg)  # left eyelid half
+                        gfx.fill_triangle(mid_x, ly-1, lx+lw, ly-1, lx+lw, ly+tired_h-1, bg)  # right eyelid half
+                    
+                    # Draw angry top eyelids
+                    if not cyclops:
+                        gfx.fill_triangle(lx, ly-1, lx+lw, ly-1, lx+lw, ly+angry_h-1, bg)  # left eye
+                        gfx.fill_triangle(rx, ry-1, rx+rw, ry-1, rx, ry+angry_h-1, bg)  # right eye
+                    else:
+                        # Cyclops angry eyelids
+                        gfx.fill_triangle(lx, ly-1, mid_x, ly-1, mid_x, ly+angry_h-1, bg)  # left eyelid half
+                        gfx.fill_triangle(mid_x, ly-1, lx+lw, ly-1, mid_x, ly+angry_h-1, bg)  # right eyelid half
+                    
+                    # Draw happy bottom eyelids
+                    gfx.fill_rrect(lx-1, (ly+lh)-happy_off+1, lw+2, self.eyeLheightDefault, lr, bg)  # left eye
+                    if not cyclops:
+                        gfx.fill_rrect(rx-1, (ry+rh)-happy_off+1, rw+2, self.eyeRheightDefault, rr, bg)  # right eye
+                
+                if self._frame_cache_limit:
+                    frame_cache[frame_key] = self.eye_surface.copy()
+                    if len(frame_cache) > self._frame_cache_limit:
+                        frame_cache.popitem(last=False)
+            
         self.on_show(self)  # show drawings on display
 
 def main():
@@ -1181,13 +1437,15 @@ def main():
         if config.idle_mode:
             roboeyes.set_idle_mode(True, config.idle_interval, config.idle_variation)
         
-        # Start the application
-        print(f"Starting RoboEyes Desktop...")
-        print(f"Window size: {config.window_width}x{config.window_height}")
-        print(f"Display size: {config.display_width}x{config.display_height}")
-        print(f"Frame rate: {config.frame_rate} FPS")
+        # Start the application (startup banner only in debug mode)
         if config.debug:
-            print(f"Configuration: {config}")
+            print("\n".join([
+                "Starting RoboEyes Desktop...",
+                f"Window size: {config.window_width}x{config.window_height}",
+                f"Display size: {config.display_width}x{config.display_height}",
+                f"Frame rate: {config.frame_rate} FPS",
+                f"Configuration: {config}",
+            ]))
         
         roboeyes.run()
         